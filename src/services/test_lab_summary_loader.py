@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from copy import copy
 from dataclasses import dataclass
 from pathlib import Path
@@ -22,6 +23,20 @@ from ..data.models import CollaudoSummary, SchedaSummary, TestLabSummary
 
 logger = logging.getLogger(__name__)
 
+_NORMALIZE_RE = re.compile(r"[^a-z0-9%]+")
+_NORMALIZE_TRANSLATION = str.maketrans({"ø": "o", "φ": "o"})
+
+
+def _normalize_text_impl(text: str) -> str:
+    text = text.strip().lower()
+    if not text.isascii():
+        text = text.translate(_NORMALIZE_TRANSLATION)
+    return _NORMALIZE_RE.sub("", text)
+
+
+# Header labels and sheet names repeat heavily across rows and workbooks.
+_normalize_text_str = lru_cache(maxsize=4096)(_normalize_text_impl)
+
 
 @dataclass
 class _WorkbookExtractionResult:
@@ -107,9 +122,29 @@ class TestLabSummaryLoader:
         "mmh2obc": "mmH2O BC",
     }
 
+    # Exact normalized labels of the Scheda summary rows
+    _SUMMARY_LABELS: Dict[str, str] = {
+        "media": "media",
+        "min": "min",
+        "minimo": "min",
+        "minimi": "min",
+        "max": "max",
+        "massimo": "max",
+        "massimi": "max",
+    }
+
+    # Prefixes for the remaining variants ("minima", "massime", ...)
+    _SUMMARY_LABEL_PREFIXES: Dict[str, str] = {
+        "minim": "min",
+        "massim": "max",
+    }
+
     def __init__(self, base_path: Optional[str], logger_: Optional[logging.Logger] = None) -> None:
         self.base_path = Path(base_path) if base_path else None
         self.logger = logger_ or logger
+        # Successful lookups keyed by requested test number; a lookup scans
+        # every year folder, and reports ask for the same test repeatedly.
+        self._locate_cache: Dict[str, TestLabWorkbookMatch] = {}
 
     # ------------------------------------------------------------------
     @property
@@ -179,19 +214,32 @@ class TestLabSummaryLoader:
             self.logger.debug("Test lab base directory not configured; skipping lookup")
             return None
 
+        cached = self._locate_cache.get(test_number)
+        if cached is not None:
+            if cached.path.exists():
+                self.logger.debug("Using cached workbook location for %s: %s", test_number, cached.path)
+                return cached
+            del self._locate_cache[test_number]
+
         match = self._locate_workbook(test_number)
         if not match:
             return None
 
         workbook_path, matched_stem, match_strategy = match
         year_folder = self._derive_year_folder(workbook_path)
-        return TestLabWorkbookMatch(
+        result = TestLabWorkbookMatch(
             requested_test_number=test_number,
             matched_test_number=matched_stem,
             match_strategy=match_strategy,
             path=workbook_path,
             year_folder=year_folder,
         )
+        self._locate_cache[test_number] = result
+        return result
+
+    def clear_cache(self) -> None:
+        """Forget cached workbook locations so the next lookup rescans the folders."""
+        self._locate_cache.clear()
 
     def _locate_workbook(self, test_number: str) -> Optional[Tuple[Path, str, str]]:
         assert self.base_path is not None  # guarded by available property
@@ -458,10 +506,9 @@ class TestLabSummaryLoader:
         max_rows = ws.max_row or 0
         max_cols = min(ws.max_column or 0, 80)
         label_hits: List[tuple[int, str]] = []
-        for row_idx in range(1, max_rows + 1):
-            row_iter = ws.iter_rows(min_row=row_idx, max_row=row_idx, max_col=max_cols)
-            row_cells = next(row_iter, tuple())
-            label = self._detect_summary_label(row_cells)
+        row_values_iter = ws.iter_rows(min_row=1, max_row=max_rows, max_col=max_cols, values_only=True)
+        for row_idx, row_values in enumerate(row_values_iter, start=1):
+            label = self._detect_summary_label(row_values)
             if label in {"media", "min", "max"}:
                 label_hits.append((row_idx, label))
 
@@ -562,10 +609,9 @@ class TestLabSummaryLoader:
             window_hi = min(max_rows, (representative_row if isinstance(representative_row, int) else 1) + 5)
             header_row_idx = best_anchor
             header_map = mapping_by_anchor.get(header_row_idx, {})
-            for r in range(window_lo, window_hi + 1):
-                row_iter = ws.iter_rows(min_row=r, max_row=r, max_col=max_cols)
-                row_cells = next(row_iter, tuple())
-                label = self._detect_summary_label(row_cells)
+            window_rows = ws.iter_rows(min_row=window_lo, max_row=window_hi, max_col=max_cols, values_only=True)
+            for r, row_values in enumerate(window_rows, start=window_lo):
+                label = self._detect_summary_label(row_values)
                 if label in {"media", "min", "max"} and label.capitalize() not in best_rows:
                     # Ensure we still use the same header anchor
                     # (nearest above r must be best_anchor)
@@ -726,43 +772,53 @@ class TestLabSummaryLoader:
         return candidates
 
     # ------------------------------------------------------------------
-    def _detect_summary_label(self, row_cells) -> str:
-        if row_cells and isinstance(row_cells[0], tuple):
+    def _detect_summary_label(self, row_values) -> str:
+        """Classify a row of raw cell values (``iter_rows(values_only=True)``)."""
+        if row_values and isinstance(row_values[0], tuple):
             # Flatten when iter_rows produced a tuple container inside a list
-            iterable = (cell for group in row_cells for cell in group)
+            iterable = (value for group in row_values for value in group)
         else:
-            iterable = iter(row_cells)
+            iterable = iter(row_values)
 
-        for cell in iterable:
-            normalized = self._normalize_text(getattr(cell, "value", None))
+        for value in iterable:
+            normalized = self._normalize_text(value)
             if not normalized:
                 continue
-            # Accept common variations and substrings for labels
-            if (normalized == "media" or normalized.startswith("med") or "media" in normalized):
-                return "media"
-            if (
-                normalized == "min"
-                or normalized.startswith("minim")
-                or normalized in {"minimo", "minimi", "min."}
-            ):
-                return "min"
-            if (
-                normalized == "max"
-                or normalized.startswith("massim")
-                or normalized in {"massimo", "massimi", "max."}
-            ):
-                return "max"
+            label = self._classify_summary_label(normalized)
+            if label:
+                return label
         return ""
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_summary_label(normalized: str) -> str:
+        """Map a normalized cell text to ``media``/``min``/``max`` (or ``""``).
+
+        Cached because the same few strings recur in every row of a sheet.
+        """
+        # Accept common variations and substrings for labels
+        label = TestLabSummaryLoader._SUMMARY_LABELS.get(normalized)
+        if label:
+            return label
+        if normalized.startswith("med") or "media" in normalized:
+            return "media"
+        prefixes = TestLabSummaryLoader._SUMMARY_LABEL_PREFIXES
+        return prefixes.get(normalized[:5]) or prefixes.get(normalized[:6]) or ""
+
     # ------------------------------------------------------------------
     def _collect_notes(self, ws: Worksheet, header_row_idx: int) -> List[str]:
         notes: List[str] = []
         max_row = min(ws.max_row, header_row_idx + 10)
-        for row_idx in range(header_row_idx + 1, max_row + 1):
+        # Notes are generally stored in columns B-E
+        for row_values in ws.iter_rows(
+            min_row=header_row_idx + 1,
+            max_row=max_row,
+            min_col=2,
+            max_col=5,
+            values_only=True,
+        ):
             parts: List[str] = []
-            # Notes are generally stored in columns B-E
-            for col_idx in range(2, 6):
-                value = ws.cell(row=row_idx, column=col_idx).value
+            for value in row_values:
                 if value is None:
                     continue
                 text = str(value).strip()
@@ -785,6 +841,11 @@ class TestLabSummaryLoader:
             text = value.strip()
             if not text:
                 return None
+            # Fast path: plain numbers need none of the separator rewriting below
+            try:
+                return float(text)
+            except ValueError:
+                pass
             text = text.replace("\u00a0", "")
             # Handle European decimal separators (e.g. 1.234,56)
             if "," in text and "." in text:
@@ -802,10 +863,10 @@ class TestLabSummaryLoader:
     def _normalize_text(value: object) -> str:
         if value is None:
             return ""
-        text = str(value).strip().lower()
-        text = text.replace("ø", "o").replace("φ", "o")
-        text = re.sub(r"[^a-z0-9%]+", "", text)
-        return text
+        if isinstance(value, str):
+            return _normalize_text_str(value)
+        # Numbers and dates are rarely repeated labels; keep them out of the cache
+        return _normalize_text_impl(str(value))
 
     @staticmethod
     def _column_index(cell) -> Optional[int]:
@@ -903,29 +964,37 @@ class TestLabSummaryLoader:
         for row_num, row_dim in source_sheet.row_dimensions.items():
             target_sheet.row_dimensions[row_num].height = row_dim.height
         
-        # Copy cells with formatting
+        # Copy cells with formatting. Style indices point into the owning
+        # workbook's style tables, so each distinct source style is translated
+        # once and the resulting StyleArray is reused for matching cells.
+        same_workbook = source_sheet.parent is target_sheet.parent
+        translated_styles: Dict[tuple, Any] = {}
         for row in source_sheet.iter_rows():
             for cell in row:
-                target_cell = target_sheet[cell.coordinate]
-                
-                # Copy value or formula
-                if cell.data_type == 'f':  # Formula
-                    target_cell.value = cell.value
-                else:
-                    target_cell.value = cell.value
-                
-                # Copy formatting
-                if cell.has_style:
-                    target_cell.font = copy(cell.font)
-                    target_cell.border = copy(cell.border)
-                    target_cell.fill = copy(cell.fill)
-                    target_cell.number_format = cell.number_format
-                    target_cell.protection = copy(cell.protection)
-                    target_cell.alignment = copy(cell.alignment)
-        
+                target_cell = target_sheet.cell(row=cell.row, column=cell.column)
+                target_cell.value = cell.value  # formulas are kept as-is
+
+                if not cell.has_style:
+                    continue
+                if same_workbook:
+                    target_cell._style = copy(cell._style)
+                    continue
+                style_key = tuple(cell._style)
+                cached = translated_styles.get(style_key)
+                if cached is not None:
+                    target_cell._style = copy(cached)
+                    continue
+                target_cell.font = copy(cell.font)
+                target_cell.border = copy(cell.border)
+                target_cell.fill = copy(cell.fill)
+                target_cell.number_format = cell.number_format
+                target_cell.protection = copy(cell.protection)
+                target_cell.alignment = copy(cell.alignment)
+                translated_styles[style_key] = copy(target_cell._style)
+
         # Copy merged cells
         for merged_range in source_sheet.merged_cells.ranges:
-            target_sheet.merge_cells(str(merged_range))
+            target_sheet.merge_cells(merged_range.coord)
 
     # ------------------------------------------------------------------
     def _extract_raw_sheets(self, workbook_path: Path) -> List[Dict[str, Any]]:
@@ -954,30 +1023,24 @@ class TestLabSummaryLoader:
                 normalized = self._normalize_text(sheet_name)
                 if any(k in normalized for k in ["scheda", "collaudo", "carichi"]):
                     ws = wb[sheet_name]
+                    # Only explicit sizes matter to the report builder; unset
+                    # dimensions (None) fall back to the default size anyway.
                     sheet_data = {
                         "name": sheet_name,
-                        "values": [],
-                        "merges": [],
-                        "col_widths": {},
-                        "row_heights": {}
+                        "values": [list(row) for row in ws.iter_rows(values_only=True)],
+                        "merges": [merged_range.coord for merged_range in ws.merged_cells.ranges],
+                        "col_widths": {
+                            col_letter: col_dim.width
+                            for col_letter, col_dim in ws.column_dimensions.items()
+                            if col_dim.width is not None
+                        },
+                        "row_heights": {
+                            row_idx: row_dim.height
+                            for row_idx, row_dim in ws.row_dimensions.items()
+                            if row_dim.height is not None
+                        },
                     }
-                    
-                    # Extract values
-                    for row in ws.iter_rows(values_only=True):
-                        sheet_data["values"].append(list(row))
-                        
-                    # Extract merges
-                    for merged_range in ws.merged_cells.ranges:
-                        sheet_data["merges"].append(str(merged_range))
-                        
-                    # Extract column widths
-                    for col_letter, col_dim in ws.column_dimensions.items():
-                        sheet_data["col_widths"][col_letter] = col_dim.width
-                        
-                    # Extract row heights
-                    for row_idx, row_dim in ws.row_dimensions.items():
-                        sheet_data["row_heights"][row_idx] = row_dim.height
-                        
+
                     raw_sheets.append(sheet_data)
                     self.logger.debug("Extracted raw sheet: %s", sheet_name)
                     
@@ -9,21 +9,40 @@ This script will:
 
 Adjust SOURCE_ROOT to your environment if needed.
 """
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+import heapq
+import os
 import shutil
 import json
 import re
 from datetime import datetime, timezone
-import openpyxl
 
 
 # Configuration - change if needed
 SOURCE_ROOT = Path(r"C:\Users\aintorbida\OneDrive - AMETEK Inc\ENG & Quality\UTE_wrk\LAB\TEST_LAB\CARICHI NOMINALI")
 TARGET_LOGS = Path(__file__).resolve().parents[2] / "logs"
 MAX_FILES = 20
+COPY_WORKERS = 8
+MIN_SUMMARY_ROWS = 2  # MEDIA + SIGMA
 
 TARGET_LOGS.mkdir(parents=True, exist_ok=True)
 
+# One combined pattern for every field hint; ``lastgroup`` names the field.
+_FIELD_RE = re.compile(
+    r"(?P<test_number>prova n|prova\s*:)"
+    r"|(?P<sap_code>cod(?:ice)?\s*sap)"
+    r"|(?P<date>\bdata\b|date)"
+    r"|(?P<summary>media|sigma)",
+    re.I,
+)
+_WS_RE = re.compile(r"\s+")
+_KEY_FIELDS = frozenset({"test_number", "sap_code", "date"})
+
+
+def _mtime(path: Path) -> float:
+    return path.stat().st_mtime
+
 
 def find_source_xlsx_files(limit=MAX_FILES):
     """Find recent .xlsx files across year folders (searches depth 2)."""
@@ -32,36 +51,42 @@ def find_source_xlsx_files(limit=MAX_FILES):
         return files
     # Look in year folders first (directories that look like 4-digit years)
     for year_dir in sorted([p for p in SOURCE_ROOT.iterdir() if p.is_dir()], reverse=True):
-        # collect .xlsx files (ignore everything else)
-        for f in sorted(year_dir.glob("*.xlsx"), key=lambda p: p.stat().st_mtime, reverse=True):
-            files.append(f)
-            if len(files) >= limit:
-                return files
+        # collect the newest .xlsx files (ignore everything else); nlargest keeps
+        # a bounded heap instead of sorting the whole folder
+        files.extend(heapq.nlargest(limit - len(files), year_dir.glob("*.xlsx"), key=_mtime))
+        if len(files) >= limit:
+            return files
     # fallback: also look at top-level .xlsx
-    for f in sorted(SOURCE_ROOT.glob("*.xlsx"), key=lambda p: p.stat().st_mtime, reverse=True):
-        if f not in files:
-            files.append(f)
-            if len(files) >= limit:
-                return files
+    seen = set(files)
+    top_level = (f for f in SOURCE_ROOT.glob("*.xlsx") if f not in seen)
+    files.extend(heapq.nlargest(limit - len(files), top_level, key=_mtime))
     return files
 
 
+def _copy_sample(src: Path):
+    dst = TARGET_LOGS / src.name
+    try:
+        shutil.copy2(src, dst)
+        return dst
+    except Exception as e:
+        print(f"Failed to copy {src}: {e}")
+        return None
+
+
 def copy_samples(files):
-    copied = []
-    for src in files:
-        dst = TARGET_LOGS / src.name
-        try:
-            shutil.copy2(src, dst)
-            copied.append(dst)
-        except Exception as e:
-            print(f"Failed to copy {src}: {e}")
-    return copied
+    # Copying is I/O bound (the GIL is released), so threads overlap the waits
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        results = list(pool.map(_copy_sample, files))
+    return [dst for dst in results if dst is not None]
 
 
 def text_norm(s):
     if s is None:
         return ""
-    return re.sub(r"\s+", " ", str(s)).strip()
+    if isinstance(s, str):
+        return _WS_RE.sub(" ", s).strip()
+    # numbers and dates never contain whitespace runs worth collapsing
+    return str(s).strip()
 
 
 def find_right_value_cell(ws, row: int, col: int, max_offset: int = 6):
@@ -74,6 +99,8 @@ def find_right_value_cell(ws, row: int, col: int, max_offset: int = 6):
 
 
 def extract_from_workbook(path: Path):
+    import openpyxl  # deferred: heavy import, only needed once files are found
+
     info = {"file": str(path), "sheets": {}, "found": False}
     try:
         wb = openpyxl.load_workbook(path, data_only=True)
@@ -85,16 +112,24 @@ def extract_from_workbook(path: Path):
         ws = wb[sheet]
         sheet_info = {"rows_scanned": 0, "found_fields": {}}
 
+        found_fields = sheet_info["found_fields"]
+        scan_complete = False
+
         # scan first 80 rows x 20 cols for hints
         for r in ws.iter_rows(min_row=1, max_row=80, min_col=1, max_col=20, values_only=False):
+            if scan_complete:
+                break
             sheet_info["rows_scanned"] += 1
             for cell in r:
                 val = cell.value
                 if val is None:
                     continue
                 v = text_norm(val)
+                hits = {m.lastgroup for m in _FIELD_RE.finditer(v)}
+                if not hits:
+                    continue
                 # detect test number line
-                if re.search(r"prova n|prova n\W|prova numero|prova\s*:\s*", v, re.I):
+                if "test_number" in hits:
                     if "test_number" not in sheet_info["found_fields"]:
                         row_idx = cell.row or 0
                         col_idx = cell.column or 0
@@ -104,7 +139,7 @@ def extract_from_workbook(path: Path):
                                 "value_cell": target.coordinate,
                                 "value": text_norm(target.value)
                             }
-                if re.search(r"cod(ice)?\s*sap", v, re.I):
+                if "sap_code" in hits:
                     if "sap_code" not in sheet_info["found_fields"]:
                         row_idx = cell.row or 0
                         col_idx = cell.column or 0
@@ -114,7 +149,7 @@ def extract_from_workbook(path: Path):
                                 "value_cell": target.coordinate,
                                 "value": text_norm(target.value)
                             }
-                if re.search(r"\bdata\b|date", v, re.I):
+                if "date" in hits:
                     if "date" not in sheet_info["found_fields"]:
                         row_idx = cell.row or 0
                         col_idx = cell.column or 0
@@ -129,7 +164,7 @@ def extract_from_workbook(path: Path):
                                 "value_cell": target.coordinate,
                                 "value": formatted
                             }
-                if re.search(r"media|sigma", v, re.I):
+                if "summary" in hits:
                     # capture the row values for summary rows
                     row_idx = cell.row or 0
                     if not row_idx:
@@ -139,6 +174,14 @@ def extract_from_workbook(path: Path):
                     key = v.upper()
                     sheet_info["found_fields"]["summary_rows"][key] = {"row": cell.row, "values": row_vals}
 
+                # stop scanning once every field and enough summary rows are known
+                if (
+                    _KEY_FIELDS <= found_fields.keys()
+                    and len(found_fields.get("summary_rows", ())) >= MIN_SUMMARY_ROWS
+                ):
+                    scan_complete = True
+                    break
+
         # Also detect if sheet name is exactly our target
         if sheet.lower() in ("scheda sr", "scheda_sr"):
             sheet_info["sheet_type"] = "scheda"
@@ -152,24 +195,31 @@ def extract_from_workbook(path: Path):
     return info
 
 
+def _analyze_sample(path: Path):
+    print(f"Analyzing {path.name}...")
+    try:
+        return extract_from_workbook(path)
+    except Exception as e:
+        return {"file": str(path), "error": str(e)}
+
+
 def main():
     samples = find_source_xlsx_files()
     print(f"Found {len(samples)} source .xlsx files to copy")
     copied = copy_samples(samples)
     print(f"Copied {len(copied)} files into {TARGET_LOGS}")
 
-    results = []
-    for f in copied:
-        print(f"Analyzing {f.name}...")
-        try:
-            res = extract_from_workbook(f)
-            results.append(res)
-        except Exception as e:
-            results.append({"file": str(f), "error": str(e)})
-
     out = TARGET_LOGS / "analysis_report.json"
+    generated_at = json.dumps(datetime.now(timezone.utc).isoformat())
     with open(out, "w", encoding="utf-8") as fh:
-        json.dump({"generated_at": datetime.now(timezone.utc).isoformat(), "results": results}, fh, indent=2, ensure_ascii=False)
+        # Stream each result as it arrives instead of holding all of them in memory
+        fh.write(f'{{\n  "generated_at": {generated_at},\n  "results": [')
+        # Workbook parsing is CPU bound and independent per file
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for index, res in enumerate(pool.map(_analyze_sample, copied, chunksize=1)):
+                fh.write(",\n" if index else "\n")
+                fh.write(json.dumps(res, indent=2, ensure_ascii=False))
+        fh.write("\n  ]\n}\n")
 
     print(f"Analysis written to: {out}")
 
@@ -21,10 +21,12 @@ from typing import List, Optional
 
 from src import directory_config
 
+_NORM_RE = re.compile(r"[^0-9A-Za-z]+")
+
 
 def normalize_test_number(test_number: str) -> str:
     """Apply the same normalization logic as TestLabSummaryLoader."""
-    return re.sub(r"[^0-9A-Za-z]+", "", test_number or "").upper()
+    return _NORM_RE.sub("", test_number or "").upper()
 
 
 def get_test_lab_directory() -> Optional[Path]:
@@ -82,10 +84,11 @@ def main():
     
     # Get test numbers from command line
     test_numbers = sys.argv[1:] if len(sys.argv) > 1 else []
+    # Normalize once; both sides are upper-cased so plain comparisons suffice
+    norm_tests = [(t, normalize_test_number(t)) for t in test_numbers]
     if test_numbers:
         print(f"Searching for test numbers: {', '.join(test_numbers)}")
-        normalized = [normalize_test_number(t) for t in test_numbers]
-        print(f"Normalized forms: {', '.join(normalized)}")
+        print(f"Normalized forms: {', '.join(norm for _, norm in norm_tests)}")
         print()
     
     # Scan subdirectories
@@ -120,18 +123,13 @@ def main():
             print(f"      • {file.name}")
             
             # Check if this file matches any requested test numbers
-            if test_numbers:
-                for test_num in test_numbers:
-                    norm_test = normalize_test_number(test_num)
-                    norm_stem = normalize_test_number(file_stem)
-                    
-                    exact_match = would_match(norm_stem, norm_test, allow_prefix=False)
-                    prefix_match = would_match(norm_stem, norm_test, allow_prefix=True)
-                    
-                    if exact_match:
+            if norm_tests:
+                norm_stem = normalize_test_number(file_stem)
+                for test_num, norm_test in norm_tests:
+                    if norm_stem == norm_test:
                         print(f"        ✓ EXACT MATCH for {test_num} (normalized: {norm_test})")
                         matches_found.setdefault(test_num, []).append((str(file), "exact"))
-                    elif prefix_match:
+                    elif norm_stem.startswith(norm_test):
                         print(f"        ≈ PREFIX MATCH for {test_num} (normalized: {norm_test})")
                         matches_found.setdefault(test_num, []).append((str(file), "prefix"))
         
@@ -147,8 +145,7 @@ def main():
     
     if test_numbers:
         print("Match Results:")
-        for test_num in test_numbers:
-            norm_test = normalize_test_number(test_num)
+        for test_num, norm_test in norm_tests:
             print(f"  {test_num} (normalized: {norm_test}):")
             
             if test_num in matches_found:
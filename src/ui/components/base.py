@@ -3,7 +3,7 @@ Base classes for GUI components
 """
 import flet as ft
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable
 from abc import ABC, abstractmethod
 
 try:
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 class BaseComponent(ABC):
     """Base class for all GUI components"""
+
+    __slots__ = ("parent_gui", "_component")
     
     def __init__(self, parent_gui=None):
         self.parent_gui = parent_gui
@@ -57,6 +59,8 @@ class BaseComponent(ABC):
 
 class BaseTab(BaseComponent):
     """Base class for tab implementations"""
+
+    __slots__ = ("tab_name", "tab_icon")
     
     def __init__(self, parent_gui=None):
         super().__init__(parent_gui)
@@ -79,48 +83,64 @@ class BaseTab(BaseComponent):
 
 class ProgressIndicators:
     """Manages progress indicators for workflow steps"""
+
+    __slots__ = ("_rings", "_icons")
     
     def __init__(self):
-        self.progress_rings = {}
-        self.status_icons = {}
+        # Steps are dense (1..N), so index parallel lists with ``step - 1``
+        self._rings: List[ft.ProgressRing] = []
+        self._icons: List[ft.Icon] = []
         
     def create_indicators(self, step_count: int):
         """Create progress rings and status icons for the given number of steps"""
-        for i in range(1, step_count + 1):
-            self.progress_rings[i] = ft.ProgressRing(
+        self._rings = [
+            ft.ProgressRing(
                 width=16, 
                 height=16, 
                 stroke_width=2, 
                 visible=False
             )
-            self.status_icons[i] = ft.Icon(
+            for _ in range(step_count)
+        ]
+        self._icons = [
+            ft.Icon(
                 ft.Icons.CHECK_CIRCLE, 
                 color="green", 
                 size=16, 
                 visible=False
             )
+            for _ in range(step_count)
+        ]
+
+    def _index(self, step: int) -> Optional[int]:
+        """Return the list index for *step*, or None when out of range"""
+        if 1 <= step <= len(self._rings):
+            return step - 1
+        return None
     
     def show_progress(self, step: int):
         """Show progress indicator for a step"""
-        if step in self.progress_rings:
-            self.progress_rings[step].visible = True
-            self.status_icons[step].visible = False
+        idx = self._index(step)
+        if idx is not None:
+            self._rings[idx].visible = True
+            self._icons[idx].visible = False
     
     def hide_progress(self, step: int):
         """Hide progress indicator for a step"""
-        if step in self.progress_rings:
-            self.progress_rings[step].visible = False
+        idx = self._index(step)
+        if idx is not None:
+            self._rings[idx].visible = False
     
     def show_success(self, step: int):
         """Show success indicator for a step"""
-        if step in self.progress_rings and step in self.status_icons:
-            self.progress_rings[step].visible = False
-            self.status_icons[step].visible = True
+        idx = self._index(step)
+        if idx is not None:
+            self._rings[idx].visible = False
+            self._icons[idx].visible = True
     
     def get_indicators_for_step(self, step: int) -> tuple:
         """Get progress ring and status icon for a step"""
-        return (
-            self.progress_rings.get(step), 
-            self.status_icons.get(step)
-        )
-
+        idx = self._index(step)
+        if idx is None:
+            return None, None
+        return self._rings[idx], self._icons[idx]
@@ -3,11 +3,29 @@ Dialog components for the GUI
 """
 import flet as ft
 import logging
+from collections import Counter
 from typing import List, Callable, Optional
 from .base import BaseComponent
 
 logger = logging.getLogger(__name__)
 
+# Flet enum members and styles resolved once at import instead of on every build()
+_BOLD = ft.FontWeight.BOLD
+_END = ft.MainAxisAlignment.END
+_AUTO = ft.ScrollMode.AUTO
+_BORDER_GREY = ft.border.all(1, "grey")
+
+
+def _replace_overlay_dialog(page, previous: Optional[ft.AlertDialog], dialog: ft.AlertDialog) -> None:
+    """Put ``dialog`` in the page overlay, removing the ``previous`` build it replaces."""
+    overlay = page.overlay
+    if previous is not None:
+        try:
+            overlay.remove(previous)
+        except ValueError:
+            pass
+    overlay.append(dialog)
+
 
 class SAPSelectionDialog(BaseComponent):
     """Dialog for selecting which SAP codes to compare"""
@@ -21,50 +39,62 @@ class SAPSelectionDialog(BaseComponent):
         self.on_confirm = on_confirm
         self.on_cancel = on_cancel
         self.sap_checkboxes = []
+        # Inputs the cached dialog (``self._component``) was built from
+        self._built_sap_codes: Optional[tuple] = None
+        self._built_tests: Optional[List] = None
+        self._built_test_count = 0
+        self._dlg_ref: Optional[ft.AlertDialog] = None  # dialog currently in the overlay
         
     def build(self) -> ft.AlertDialog:
         """Build the SAP selection dialog"""
+        # Count how many tests have each SAP code in a single pass
+        test_counts = Counter(test.sap_code for test in self.tests_to_process)
+
         # Create checkboxes for each SAP code
-        self.sap_checkboxes = []
-        for sap in self.sap_codes:
-            # Count how many tests have this SAP code
-            test_count = sum(1 for test in self.tests_to_process if test.sap_code == sap)
-            checkbox = ft.Checkbox(
-                label=f"{sap} ({test_count} test{'s' if test_count != 1 else ''})",
+        self.sap_checkboxes = [
+            ft.Checkbox(
+                label=self._checkbox_label(sap, test_counts.get(sap, 0)),
                 value=True,  # Default to selected
                 data=sap
             )
-            self.sap_checkboxes.append(checkbox)
+            for sap in self.sap_codes
+        ]
 
         dialog_content = ft.Column([
-            ft.Text("Select SAP codes to include in comparison:", size=16, weight=ft.FontWeight.BOLD),
+            ft.Text("Select SAP codes to include in comparison:", size=16, weight=_BOLD),
             ft.Text("Multiple SAP codes found in your selected tests. Choose which ones to compare:"),
             ft.Container(
-                content=ft.Column(self.sap_checkboxes, spacing=5, scroll=ft.ScrollMode.AUTO),
+                content=ft.Column(self.sap_checkboxes, spacing=5, scroll=_AUTO),
                 height=200,  # Limit height so it doesn't overflow
             ),
             ft.Row([
                 ft.TextButton("Cancel", on_click=self._on_cancel),
                 ft.ElevatedButton("Generate Report", on_click=self._on_confirm)
-            ], alignment=ft.MainAxisAlignment.END)
-        ], spacing=10, scroll=ft.ScrollMode.AUTO)
+            ], alignment=_END)
+        ], spacing=10, scroll=_AUTO)
 
         return ft.AlertDialog(
             title=ft.Text("SAP Code Selection"),
             content=dialog_content,
-            actions_alignment=ft.MainAxisAlignment.END,
+            actions_alignment=_END,
         )
     
+    @staticmethod
+    def _checkbox_label(sap: str, test_count: int) -> str:
+        noun = "test" if test_count == 1 else "tests"
+        return f"{sap} ({test_count} {noun})"
+    
     def _on_confirm(self, e):
         """Handle dialog confirmation"""
-        selected_saps = [cb.data for cb in self.sap_checkboxes if cb.value]
-        logger.info(f"User selected SAPs for comparison: {selected_saps}")
-        
-        if not selected_saps:
+        if not any(cb.value for cb in self.sap_checkboxes):
+            logger.info("User confirmed SAP selection with nothing selected")
             if self.parent_gui and hasattr(self.parent_gui, 'update_status'):
                 self.parent_gui.update_status("Error: Please select at least one SAP code for comparison.", color="red")
             return
         
+        selected_saps = [cb.data for cb in self.sap_checkboxes if cb.value]
+        logger.info(f"User selected SAPs for comparison: {selected_saps}")
+        
         # Close dialog first
         self._close_dialog()
         
@@ -83,18 +113,46 @@ class SAPSelectionDialog(BaseComponent):
     def _close_dialog(self):
         """Close the dialog"""
         if self.parent_gui and hasattr(self.parent_gui, 'page'):
-            for overlay in self.parent_gui.page.overlay[:]:
-                if isinstance(overlay, ft.AlertDialog):
-                    overlay.open = False
-                    self.parent_gui.page.overlay.remove(overlay)
+            dialog = self._dlg_ref
+            if dialog is None:
+                return
+            # Remove only the dialog this instance showed
+            dialog.open = False
+            try:
+                self.parent_gui.page.overlay.remove(dialog)
+            except ValueError:
+                pass
+            self._dlg_ref = None
             self.safe_update()
     
+    def _invalidate_if_stale(self):
+        """Drop the cached dialog when the SAP codes or tests changed since it was built"""
+        sap_codes = tuple(self.sap_codes)
+        if (
+            self._component is not None
+            and self._built_sap_codes == sap_codes
+            and self._built_tests is self.tests_to_process
+            and self._built_test_count == len(self.tests_to_process)
+        ):
+            # Reuse the widgets; restore the default selection
+            for checkbox in self.sap_checkboxes:
+                checkbox.value = True
+            return
+        self._component = None
+        self._built_sap_codes = sap_codes
+        self._built_tests = self.tests_to_process
+        self._built_test_count = len(self.tests_to_process)
+
     def show(self):
         """Show the dialog"""
         if self.parent_gui and hasattr(self.parent_gui, 'page'):
-            dialog = self.build()
-            self.parent_gui.page.overlay.append(dialog)
+            self._invalidate_if_stale()
+            dialog = self.component
+            if self._dlg_ref is not dialog:
+                _replace_overlay_dialog(self.parent_gui.page, self._dlg_ref, dialog)
+                self._dlg_ref = dialog
             dialog.open = True
+            # Overlay changes only reach the client on a page update
             self.safe_update()
             logger.info("SAP selection dialog displayed")
 
@@ -105,51 +163,76 @@ class NotesDialog(BaseComponent):
     def __init__(self, parent_gui=None, test=None):
         super().__init__(parent_gui)
         self.test = test
+        self._built_for = None  # test the cached dialog was built for
+        self._dlg_ref: Optional[ft.AlertDialog] = None  # dialog currently in the overlay
     
     def build(self) -> ft.AlertDialog:
-        """Build the notes dialog"""
+        """Build the notes dialog (deferred until ``show()`` via ``component``)"""
         if not self.test:
             return ft.AlertDialog(
                 title=ft.Text("Notes"),
                 content=ft.Text("No test information available."),
             )
         
-        dialog_content = ft.Column([
-            ft.Text(f"Test: {self.test.test_lab_number} | SAP: {self.test.sap_code}", 
-                   weight=ft.FontWeight.BOLD),
-            ft.Container(
-                content=ft.Text(self.test.notes or "No notes available", selectable=True, size=14),
+        notes = self.test.notes
+        if notes:
+            notes_body = ft.Container(
+                content=ft.Text(notes, selectable=True, size=14),
                 height=300,
-                border=ft.border.all(1, "grey"),
+                border=_BORDER_GREY,
                 border_radius=5,
                 padding=10,
                 bgcolor="#f9f9f9"
-            ),
+            )
+        else:
+            # No need for the scrollable bordered box around a placeholder
+            notes_body = ft.Text("No notes available", size=14)
+        
+        dialog_content = ft.Column([
+            ft.Text(f"Test: {self.test.test_lab_number} | SAP: {self.test.sap_code}", 
+                   weight=_BOLD),
+            notes_body,
             ft.Row([
                 ft.ElevatedButton("Close", on_click=self._close_dialog)
-            ], alignment=ft.MainAxisAlignment.END)
+            ], alignment=_END)
         ], spacing=10)
 
         return ft.AlertDialog(
             title=ft.Text("Full Notes"),
             content=dialog_content,
-            actions_alignment=ft.MainAxisAlignment.END,
+            actions_alignment=_END,
         )
     
     def _close_dialog(self, e):
         """Close the dialog"""
         if self.parent_gui and hasattr(self.parent_gui, 'page'):
-            for overlay in self.parent_gui.page.overlay[:]:
-                if isinstance(overlay, ft.AlertDialog):
-                    overlay.open = False
-                    self.parent_gui.page.overlay.remove(overlay)
+            dialog = self._dlg_ref
+            if dialog is None:
+                return
+            # Remove only the dialog this instance showed
+            dialog.open = False
+            try:
+                self.parent_gui.page.overlay.remove(dialog)
+            except ValueError:
+                pass
+            self._dlg_ref = None
             self.safe_update()
     
     def show(self):
         """Show the dialog"""
         if self.parent_gui and hasattr(self.parent_gui, 'page'):
-            dialog = self.build()
-            self.parent_gui.page.overlay.append(dialog)
+            if self._built_for is not self.test:
+                self._component = None
+                self._built_for = self.test
+            dialog = self.component
+            if self._dlg_ref is dialog:
+                if dialog.open:
+                    return  # Already on screen with the same content
+                # Dismissed by clicking outside: still in the overlay, just closed
+            else:
+                _replace_overlay_dialog(self.parent_gui.page, self._dlg_ref, dialog)
+                self._dlg_ref = dialog
             dialog.open = True
+            # Overlay changes only reach the client on a page update
             self.safe_update()
 
@@ -16,19 +16,3 @@ __all__ = [
     'ReportManager',
     'WorkflowManager'
 ]
-
-from .state_manager import StateManager, AppState
-from .event_handlers import EventHandlers
-from .search_manager import SearchManager
-from .report_manager import ReportManager
-from .workflow_manager import WorkflowManager
-
-__all__ = [
-    'StateManager',
-    'AppState', 
-    'EventHandlers',
-    'SearchManager',
-    'ReportManager',
-    'WorkflowManager'
-]
-
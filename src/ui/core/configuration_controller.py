@@ -11,7 +11,8 @@ Extracted from EventHandlers as part of controller separation pattern.
 """
 
 import logging
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from ..main_gui import MotorReportAppGUI
@@ -20,6 +21,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _dlog(msg_fn: Callable[[], str]) -> None:
+    """Log ``msg_fn()`` at DEBUG, building the message only when DEBUG is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg_fn())
+
+
 class ConfigurationController:
     """
     Handles configuration-related event handlers for SAP selections.
@@ -34,6 +41,18 @@ class ConfigurationController:
         All methods are called from the Flet UI thread. Background updates
         use daemon threads and update GUI via _safe_page_update().
     """
+
+    # SAP type -> (config tab container dict attribute, checkbox updater method)
+    _SAP_DISPATCH = {
+        'comparison': ('comparison_test_lab_containers', '_update_test_lab_checkboxes'),
+        'noise': ('noise_test_lab_containers', '_update_noise_test_checkboxes'),
+    }
+    
+    # SAP types whose built checkboxes can be reused while their container lives
+    _REUSABLE_CHECKBOX_TYPES = frozenset({'comparison'})
+    
+    # Window in which missing-container rebuilds are coalesced into one refresh
+    REBUILD_DELAY_SECONDS = 0.05
     
     def __init__(self, gui: 'MotorReportAppGUI', state: 'StateManager'):
         """
@@ -45,6 +64,11 @@ class ConfigurationController:
         """
         self.gui = gui
         self.state = state
+        self._pending_rebuilds: List[Tuple[str, bool, str]] = []
+        self._rebuild_timer: Optional[threading.Timer] = None
+        self._rebuild_lock = threading.Lock()
+        # (sap_type, sap_code) -> container whose test checkboxes were last populated
+        self._checkboxes_built_for: Dict[Tuple[str, str], Any] = {}
         
         logger.debug("ConfigurationController initialized")
     
@@ -59,6 +83,8 @@ class ConfigurationController:
         3. Updates test lab checkboxes if SAP is newly selected
         4. Auto-refreshes config tab if containers are missing
         
+        Events that leave the stored selection unchanged are ignored.
+        
         Args:
             sap_type: Type of SAP - either "comparison" or "noise"
         
@@ -68,178 +94,188 @@ class ConfigurationController:
         Thread Safety:
             Handlers run on Flet UI thread. Uses _safe_page_update for UI updates.
         """
+        # Resolve the container/updater pair once per checkbox rather than per click
+        dispatch = self._SAP_DISPATCH.get(sap_type)
+        
         def handler(e):
             sap_code = e.control.data
             selected = e.control.value
             
-            logger.debug(f"SAP {sap_code} ({sap_type}) checked: {selected}")
+            logger.debug("SAP %s (%s) checked: %s", sap_code, sap_type, selected)
+            
+            # Nothing to do when the click leaves the stored selection unchanged
+            if self.state.get_sap_selection(sap_type, sap_code) == selected:
+                return
             
             # Update state
             self.state.update_sap_selection(sap_type, sap_code, selected)
             
             # Handle visibility and checkboxes based on SAP type
-            if sap_type == "comparison":
-                self._handle_comparison_sap_visibility(sap_code, selected)
-            elif sap_type == "noise":
-                self._handle_noise_sap_visibility(sap_code, selected)
+            if dispatch is not None:
+                self._handle_sap_visibility(sap_type, sap_code, selected, dispatch)
         
         return handler
     
-    def _handle_comparison_sap_visibility(self, sap_code: str, selected: bool):
+    def _handle_sap_visibility(self, sap_type: str, sap_code: str, selected: bool,
+                               dispatch: Optional[Tuple[str, str]] = None):
         """
-        Handle visibility of comparison test lab containers.
+        Handle visibility of comparison/noise test lab containers.
         
-        When a comparison SAP is selected/deselected:
-        1. Shows/hides the test lab selection container for that SAP
-        2. Updates test lab checkboxes if newly selected
+        When a SAP is selected/deselected:
+        1. Shows/hides the test selection container for that SAP
+        2. Updates the test checkboxes if newly selected
         3. Refreshes config tab if container is missing
         
         Args:
-            sap_code: SAP code for comparison
+            sap_type: Type of SAP - either "comparison" or "noise"
+            sap_code: SAP code whose checkbox changed
             selected: Whether the SAP checkbox is checked
+            dispatch: Pre-resolved ``_SAP_DISPATCH`` entry for ``sap_type``
         """
-        logger.debug(f"Handling comparison SAP {sap_code}, selected: {selected}")
+        if dispatch is None:
+            dispatch = self._SAP_DISPATCH.get(sap_type)
+            if dispatch is None:
+                return
+        container_attr, updater_name = dispatch
+        logger.debug("Handling %s SAP %s, selected: %s", sap_type, sap_code, selected)
         
-        if not hasattr(self.gui, 'config_tab'):
-            logger.debug("No config_tab attribute on GUI")
+        gui = self.gui
+        config_tab = getattr(gui, 'config_tab', None)
+        if config_tab is None:
+            logger.debug("No config_tab available on GUI")
             return
         
-        config_tab = self.gui.config_tab
-        logger.debug(f"Config tab found: {config_tab is not None}")
-        
-        if not hasattr(config_tab, 'comparison_test_lab_containers'):
-            logger.debug("Config tab does not have comparison_test_lab_containers attribute")
+        containers = getattr(config_tab, container_attr, None)
+        if containers is None:
+            logger.debug("Config tab does not have %s attribute", container_attr)
             return
         
-        containers = config_tab.comparison_test_lab_containers
-        logger.debug(f"Available containers: {list(containers.keys())}")
+        _dlog(lambda: f"Available {sap_type} containers: {list(containers)}")
         
         if sap_code in containers:
             # Container exists - update visibility
             container = containers[sap_code]
-            logger.debug(f"Container found for {sap_code}, setting visible={selected}")
+            logger.debug("%s container found for %s, setting visible=%s", sap_type, sap_code, selected)
             container.visible = selected
             
-            # If the SAP is now selected, update the test lab checkboxes
+            # If the SAP is now selected, update the test checkboxes; unchecking
+            # forgets them so re-checking rebuilds from the current selection
             if selected:
-                logger.debug(f"Updating test lab checkboxes for {sap_code}")
-                config_tab._update_test_lab_checkboxes(sap_code)
+                self._update_checkboxes(config_tab, updater_name, sap_type, sap_code, container)
+            else:
+                self._checkboxes_built_for.pop((sap_type, sap_code), None)
             
             # Update the page
             logger.debug("Updating page")
-            self.gui._safe_page_update()
+            gui._safe_page_update()
         else:
             # Container missing - attempt to rebuild
-            logger.debug(f"Container not found for {sap_code}")
-            logger.debug(f"Expected containers: {self.state.state.found_sap_codes}")
+            logger.debug("%s container not found for %s", sap_type, sap_code)
+            logger.debug("Expected containers: %s", self.state.state.found_sap_codes)
             logger.debug("Will try to build content again to create missing container")
             
-            self._rebuild_missing_container(sap_code, selected, containers, config_tab, 'comparison')
+            self._rebuild_missing_container(sap_code, selected, sap_type)
     
-    def _handle_noise_sap_visibility(self, sap_code: str, selected: bool):
+    def _update_checkboxes(self, config_tab, updater_name: str, sap_type: str,
+                           sap_code: str, container) -> None:
         """
-        Handle visibility of noise test lab containers.
+        Populate a SAP's test checkboxes unless this container already holds them.
         
-        When a noise SAP is selected/deselected:
-        1. Shows/hides the noise test selection container for that SAP
-        2. Updates noise test checkboxes if newly selected
-        3. Refreshes config tab if container is missing
-        
-        Args:
-            sap_code: SAP code for noise testing
-            selected: Whether the SAP checkbox is checked
+        Comparison checkboxes are built synchronously from state and kept in
+        sync by their own handlers, so a container that has not been replaced
+        (e.g. by a config tab refresh) can keep its controls. Noise checkboxes
+        load in the background and may be left showing an error, so they are
+        always rebuilt to retry the load.
         """
-        logger.debug(f"Handling noise SAP {sap_code}, selected: {selected}")
-        
-        if not hasattr(self.gui, 'config_tab'):
-            logger.debug("No config_tab attribute on GUI")
-            return
-        
-        config_tab = self.gui.config_tab
-        logger.debug(f"Config tab found: {config_tab is not None}")
-        
-        if not hasattr(config_tab, 'noise_test_lab_containers'):
-            logger.debug("Config tab does not have noise_test_lab_containers attribute")
+        key = (sap_type, sap_code)
+        if self._checkboxes_built_for.get(key) is container:
+            logger.debug("%s test checkboxes for %s already built", sap_type, sap_code)
             return
-        
-        containers = config_tab.noise_test_lab_containers
-        logger.debug(f"Available noise containers: {list(containers.keys())}")
-        
-        if sap_code in containers:
-            # Container exists - update visibility
-            container = containers[sap_code]
-            logger.debug(f"Noise container found for {sap_code}, setting visible={selected}")
-            container.visible = selected
-            
-            # If the SAP is now selected, update the noise test checkboxes
-            if selected:
-                logger.debug(f"Updating noise test checkboxes for {sap_code}")
-                config_tab._update_noise_test_checkboxes(sap_code)
-            
-            # Update the page
-            logger.debug("Updating page")
-            self.gui._safe_page_update()
-        else:
-            # Container missing - attempt to rebuild
-            logger.debug(f"Noise container not found for {sap_code}")
-            self._rebuild_missing_container(sap_code, selected, containers, config_tab, 'noise')
+        logger.debug("Updating %s test checkboxes for %s", sap_type, sap_code)
+        getattr(config_tab, updater_name)(sap_code)
+        if sap_type in self._REUSABLE_CHECKBOX_TYPES:
+            self._checkboxes_built_for[key] = container
     
-    def _rebuild_missing_container(self, sap_code: str, selected: bool, 
-                                   containers: dict, config_tab, container_type: str):
+    def _rebuild_missing_container(self, sap_code: str, selected: bool, container_type: str):
         """
-        Attempt to rebuild missing container by refreshing config tab.
+        Queue a missing container for recreation by a coalesced config tab refresh.
         
-        If a container is expected but not found, this triggers a refresh
-        of the config tab to recreate all containers, then retries the
-        visibility update.
+        If a container is expected but not found, the SAP is queued and a
+        short timer is armed. When it fires, the config tab is refreshed once
+        for every SAP queued in the meantime, so toggling several SAPs with
+        missing containers in quick succession rebuilds the tab only once.
         
         Args:
             sap_code: SAP code for the missing container
             selected: Desired visibility state
-            containers: Current containers dictionary
-            config_tab: Reference to config tab instance
             container_type: Either 'comparison' or 'noise'
         """
+        with self._rebuild_lock:
+            self._pending_rebuilds.append((sap_code, selected, container_type))
+            if self._rebuild_timer is not None:
+                return
+            self._rebuild_timer = threading.Timer(self.REBUILD_DELAY_SECONDS, self._trigger_rebuild)
+            self._rebuild_timer.daemon = True
+            self._rebuild_timer.start()
+    
+    def _trigger_rebuild(self):
+        run_thread = getattr(getattr(self.gui, 'page', None), 'run_thread', None)
+        if callable(run_thread):
+            run_thread(self._flush_rebuilds)
+        else:
+            self._flush_rebuilds()
+    
+    def _flush_rebuilds(self):
+        """Refresh the config tab once and replay every queued SAP against the new containers."""
+        with self._rebuild_lock:
+            pending = self._pending_rebuilds
+            self._pending_rebuilds = []
+            self._rebuild_timer = None
+        if not pending:
+            return
+        
+        gui = self.gui
         try:
-            if not hasattr(self.gui, 'workflow_manager'):
+            workflow_manager = getattr(gui, 'workflow_manager', None)
+            if workflow_manager is None:
                 logger.warning("No workflow_manager available for refresh")
                 return
             
-            logger.debug("Refreshing config tab to recreate containers...")
-            self.gui.workflow_manager.refresh_tab('config')
+            logger.debug("Refreshing config tab to recreate %d container(s)...", len(pending))
+            workflow_manager.refresh_tab('config')
             
             # After refresh, try again
-            new_config_tab = self.gui.config_tab
+            new_config_tab = getattr(gui, 'config_tab', None)
             if not new_config_tab:
                 logger.warning("Config tab not available after refresh")
                 return
             
-            # Get the appropriate containers based on type
-            container_attr = f'{container_type}_test_lab_containers'
-            if not hasattr(new_config_tab, container_attr):
-                logger.warning(f"Config tab still missing {container_attr} after refresh")
-                return
-            
-            new_containers = getattr(new_config_tab, container_attr)
-            logger.debug(f"After refresh, available containers: {list(new_containers.keys())}")
-            
-            if sap_code in new_containers:
+            # The refreshed tab has new containers; every checkbox snapshot is stale
+            self._checkboxes_built_for.clear()
+            updated = False
+            for sap_code, selected, container_type in pending:
+                # Get the appropriate containers based on type
+                container_attr, updater_name = self._SAP_DISPATCH[container_type]
+                new_containers = getattr(new_config_tab, container_attr, None)
+                if new_containers is None:
+                    logger.warning("Config tab still missing %s after refresh", container_attr)
+                    continue
+                
+                if sap_code not in new_containers:
+                    logger.warning("Container for %s still not found after refresh", sap_code)
+                    continue
+                
                 # Successfully recreated - update visibility
                 container = new_containers[sap_code]
                 container.visible = selected
-                
                 if selected:
                     # Update checkboxes based on type
-                    if container_type == 'comparison':
-                        new_config_tab._update_test_lab_checkboxes(sap_code)
-                    else:  # noise
-                        new_config_tab._update_noise_test_checkboxes(sap_code)
-                
-                self.gui._safe_page_update()
-                logger.debug(f"Successfully handled {sap_code} after refresh")
-            else:
-                logger.warning(f"Container for {sap_code} still not found after refresh")
+                    self._update_checkboxes(new_config_tab, updater_name, container_type, sap_code, container)
+                updated = True
+                logger.debug("Successfully handled %s after refresh", sap_code)
+            
+            if updated:
+                gui._safe_page_update()
                 
         except Exception as refresh_error:
-            logger.error(f"Error during config tab refresh: {refresh_error}", exc_info=True)
-
+            logger.error("Error during config tab refresh: %s", refresh_error, exc_info=True)
@@ -10,9 +10,9 @@ Handles all file and folder selection events, including:
 
 import flet as ft
 import logging
-import threading
 import os
-from typing import TYPE_CHECKING
+import threading
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..main_gui import MotorReportAppGUI
@@ -32,6 +32,9 @@ class FilePickerController:
     - Backend configuration synchronization
     """
     
+    # Picks made within this window share one backend config update
+    BACKEND_UPDATE_DELAY_SECONDS = 0.25
+    
     def __init__(self, gui: 'MotorReportAppGUI', state_manager: 'StateManager'):
         """
         Initialize the file picker controller.
@@ -42,6 +45,19 @@ class FilePickerController:
         """
         self.gui = gui
         self.state_manager = state_manager
+        # picker_context -> handler; unknown contexts fall back to the defaults below
+        self._folder_dispatch = {
+            "noise_folder": self._update_noise_folder,
+            "test_folder": self._update_tests_folder,
+        }
+        self._file_dispatch = {
+            "noise_registry": self._update_noise_registry,
+            "test_folder_via_file": self._extract_and_update_tests_folder,
+            "noise_folder_via_file": self._extract_and_update_noise_folder,
+            "save_report_via_file": self._extract_and_save_report,
+        }
+        self._backend_update_timer: Optional[threading.Timer] = None
+        self._backend_update_lock = threading.Lock()
     
     @property
     def state(self):
@@ -60,7 +76,7 @@ class FilePickerController:
         Args:
             e: File picker result event containing selected path
         """
-        logger.debug(f"on_folder_picked called with path: {e.path}")
+        logger.debug("on_folder_picked called with path: %s", e.path)
         
         if not e.path:
             logger.debug("No path selected in folder picker")
@@ -68,19 +84,13 @@ class FilePickerController:
         
         # Determine which folder was selected based on context
         context = getattr(self.state, 'picker_context', '')
-        logger.debug(f"picker_context is: {context}")
+        logger.debug("picker_context is: %s", context)
         
-        if context == "noise_folder":
-            self._update_noise_folder(e.path)
-        elif context == "test_folder":
-            self._update_tests_folder(e.path)
-        else:
-            # Default to performance test folder for backward compatibility
-            logger.debug("Updating test folder path (default context)")
-            self._update_tests_folder(e.path)
+        # Default to performance test folder for backward compatibility
+        self._folder_dispatch.get(context, self._update_tests_folder)(e.path)
         
         # Clear context and update UI
-        self._finalize_folder_selection()
+        self._finalize_selection()
     
     def on_registry_file_picked(self, e: ft.FilePickerResultEvent):
         """
@@ -96,7 +106,7 @@ class FilePickerController:
         Args:
             e: File picker result event containing selected file path
         """
-        logger.debug(f"on_registry_file_picked called with path: {e.path}")
+        logger.debug("on_registry_file_picked called with path: %s", e.path)
         
         if not e.path:
             logger.debug("No file selected")
@@ -104,25 +114,23 @@ class FilePickerController:
         
         # Determine file type based on context
         context = getattr(self.state, 'picker_context', '')
-        logger.debug(f"picker_context is: {context}")
+        logger.debug("picker_context is: %s", context)
         
-        if context == "noise_registry":
-            self._update_noise_registry(e.path)
-        elif context == "test_folder_via_file":
-            self._extract_and_update_tests_folder(e.path)
-        elif context == "noise_folder_via_file":
-            self._extract_and_update_noise_folder(e.path)
-        elif context == "save_report_via_file":
-            self._extract_and_save_report(e.path)
-        else:
-            # Default to performance registry file
-            self._update_registry_file(e.path)
+        # Default to performance registry file
+        self._file_dispatch.get(context, self._update_registry_file)(e.path)
         
         # Clear context and update UI
-        self._finalize_file_selection()
+        self._finalize_selection()
     
     # Private helper methods for specific path types
     
+    @staticmethod
+    def _apply_selected_style(text_control: ft.Text, path: str):
+        """Show ``path`` as the selected value of a path label (green, non-italic)."""
+        text_control.value = f"Selected: {path}"
+        text_control.color = "green"
+        text_control.italic = False
+    
     def _update_noise_folder(self, path: str):
         """
         Update noise folder path in state and refresh UI.
@@ -136,9 +144,7 @@ class FilePickerController:
         """
         logger.debug("Updating noise folder path")
         self.state_manager.update_paths(noise_folder=path)
-        self.gui.noise_folder_path_text.value = f"Selected: {path}"
-        self.gui.noise_folder_path_text.color = "green"
-        self.gui.noise_folder_path_text.italic = False
+        self._apply_selected_style(self.gui.noise_folder_path_text, path)
     
     def _update_tests_folder(self, path: str):
         """
@@ -154,9 +160,7 @@ class FilePickerController:
         """
         logger.debug("Updating test folder path")
         self.state_manager.update_paths(tests_folder=path)
-        self.gui.tests_folder_path_text.value = f"Selected: {path}"
-        self.gui.tests_folder_path_text.color = "green"
-        self.gui.tests_folder_path_text.italic = False
+        self._apply_selected_style(self.gui.tests_folder_path_text, path)
     
     def _update_noise_registry(self, path: str):
         """
@@ -171,9 +175,7 @@ class FilePickerController:
         """
         logger.debug("Updating noise registry path")
         self.state_manager.update_paths(noise_registry=path)
-        self.gui.noise_registry_path_text.value = f"Selected: {path}"
-        self.gui.noise_registry_path_text.color = "green"
-        self.gui.noise_registry_path_text.italic = False
+        self._apply_selected_style(self.gui.noise_registry_path_text, path)
     
     def _update_registry_file(self, path: str):
         """
@@ -188,9 +190,7 @@ class FilePickerController:
         """
         logger.debug("Updating registry file path")
         self.state_manager.update_paths(registry_file=path)
-        self.gui.registry_file_path_text.value = f"Selected: {path}"
-        self.gui.registry_file_path_text.color = "green"
-        self.gui.registry_file_path_text.italic = False
+        self._apply_selected_style(self.gui.registry_file_path_text, path)
     
     def _extract_and_update_tests_folder(self, file_path: str):
         """
@@ -204,15 +204,11 @@ class FilePickerController:
             
         Side Effects:
             - Extracts parent directory using os.path.dirname()
-            - Updates state manager with extracted folder path
-            - Updates UI to show extracted folder path
+            - Applies it like a directly picked folder (state and UI label)
         """
         folder_path = os.path.dirname(file_path)
-        logger.debug(f"Extracted folder path from file: {folder_path}")
-        self.state_manager.update_paths(tests_folder=folder_path)
-        self.gui.tests_folder_path_text.value = f"Selected: {folder_path}"
-        self.gui.tests_folder_path_text.color = "green"
-        self.gui.tests_folder_path_text.italic = False
+        logger.debug("Extracted folder path from file: %s", folder_path)
+        self._update_tests_folder(folder_path)
     
     def _extract_and_update_noise_folder(self, file_path: str):
         """
@@ -226,15 +222,11 @@ class FilePickerController:
             
         Side Effects:
             - Extracts parent directory using os.path.dirname()
-            - Updates state manager with extracted folder path
-            - Updates UI to show extracted folder path
+            - Applies it like a directly picked folder (state and UI label)
         """
         folder_path = os.path.dirname(file_path)
-        logger.debug(f"Extracted folder path from file: {folder_path}")
-        self.state_manager.update_paths(noise_folder=folder_path)
-        self.gui.noise_folder_path_text.value = f"Selected: {folder_path}"
-        self.gui.noise_folder_path_text.color = "green"
-        self.gui.noise_folder_path_text.italic = False
+        logger.debug("Extracted folder path from file: %s", folder_path)
+        self._update_noise_folder(folder_path)
     
     def _extract_and_save_report(self, file_path: str):
         """
@@ -252,34 +244,24 @@ class FilePickerController:
             - Logs warning if report generation controller unavailable
         """
         folder_path = os.path.dirname(file_path)
-        logger.debug(f"Extracted save folder path: {folder_path}")
+        logger.debug("Extracted save folder path: %s", folder_path)
         
         # Delegate to report generation controller
-        if hasattr(self.gui.event_handlers, 'report_generation_controller'):
-            self.gui.event_handlers.report_generation_controller.save_report_to_folder(folder_path)
+        report_controller = getattr(
+            getattr(self.gui, 'event_handlers', None), 'report_generation_controller', None
+        )
+        if report_controller is not None:
+            report_controller.save_report_to_folder(folder_path)
         else:
             logger.warning("Report generation controller not available")
     
-    def _finalize_folder_selection(self):
-        """
-        Finalize folder selection workflow.
-        
-        Side Effects:
-            - Clears picker_context from state
-            - Triggers UI update via _safe_page_update()
-            - Initiates backend configuration update in background thread
-        """
-        self.state.picker_context = ""
-        self.gui._safe_page_update()
-        self._trigger_backend_config_update()
-    
-    def _finalize_file_selection(self):
+    def _finalize_selection(self):
         """
-        Finalize file selection workflow.
+        Finalize a folder or file selection.
         
         Side Effects:
             - Clears picker_context from state
-            - Triggers UI update via _safe_page_update()
+            - Sends the one page update for the selection via _safe_page_update()
             - Initiates backend configuration update in background thread
         """
         self.state.picker_context = ""
@@ -288,17 +270,25 @@ class FilePickerController:
     
     def _trigger_backend_config_update(self):
         """
-        Trigger backend configuration update in a background thread.
+        Schedule a backend configuration update, debounced across picks.
         
         Ensures the backend MotorReportApp instance is updated with new
-        file/folder paths without blocking the UI thread.
+        file/folder paths without blocking the UI thread. Each call restarts
+        the delay, so a burst of picks (tests folder, registry, noise folder)
+        results in a single update with the final paths.
         
         Side Effects:
-            - Spawns daemon thread running _update_backend_config()
-            - Logs debug message on successful thread start
+            - Cancels any pending update and starts a daemon timer that runs
+              _update_backend_config() on its own thread
             - Does nothing if GUI app instance is unavailable
         """
-        if hasattr(self.gui, 'app') and self.gui.app:
-            run_in_background(self.gui._update_backend_config)
-            logger.debug("Triggered backend config update in background thread")
-
+        if not getattr(self.gui, 'app', None):
+            return
+        timer = threading.Timer(self.BACKEND_UPDATE_DELAY_SECONDS, self.gui._update_backend_config)
+        timer.daemon = True
+        with self._backend_update_lock:
+            previous, self._backend_update_timer = self._backend_update_timer, timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+        logger.debug("Scheduled backend config update")
@@ -12,12 +12,12 @@ import datetime
 import logging
 import os
 import shutil
-import subprocess
-import platform
 import tempfile
-import threading  # Keep for Lock
-from typing import Callable, Optional, TYPE_CHECKING
+from functools import cached_property
+from itertools import chain
+from typing import Callable, Optional, Sequence, TYPE_CHECKING
 
+from ..utils.folder_reveal import reveal_in_file_manager
 from ..utils.thread_pool import run_in_background
 from ..utils.error_boundary import (
     with_error_boundary,
@@ -49,10 +49,12 @@ class ReportGenerationController:
         self.gui = gui
         self.state_manager = state_manager
         self._update_button_state = update_button_state
-        self._temp_file_lock = threading.Lock()
         self._temp_files_created = set()
         self._temp_report_file: Optional[str] = None
         self._report_filename: Optional[str] = None
+        # Built on first use and reused, so the page overlay holds one of each
+        self._success_dialog: Optional[ft.AlertDialog] = None
+        self._error_dialog: Optional[ft.AlertDialog] = None
 
     # ------------------------------------------------------------------
     # Public API used by EventHandlers
@@ -86,6 +88,10 @@ class ReportGenerationController:
 
     def save_report_to_folder(self, folder_path: str) -> None:
         """Copy the generated report from temp to the specified folder."""
+        if not folder_path:
+            logger.warning("No destination folder given for saving the report")
+            return
+
         if not self._temp_report_file or not self._report_filename:
             logger.warning("No temp report file available for saving")
             return
@@ -97,8 +103,10 @@ class ReportGenerationController:
 
         try:
             final_path = os.path.join(folder_path, self._report_filename)
+            # Copied rather than moved so the same report can be saved again;
+            # copyfile skips copy2's metadata calls on a file written moments ago.
             with log_duration(logger, "copy_report_to_final_location", level=logging.DEBUG):
-                shutil.copy2(self._temp_report_file, final_path)
+                shutil.copyfile(self._temp_report_file, final_path)
 
             self.gui.status_manager.update_status(
                 f"✅ Report saved: {self._report_filename}",
@@ -148,16 +156,10 @@ class ReportGenerationController:
             if not tests_to_process:
                 raise RuntimeError("No tests selected for processing")
 
-            noise_saps = list(self.state_manager.state.selected_noise_saps)
-            comparison_saps = list(self.state_manager.state.selected_comparison_saps)
+            noise_saps, comparison_saps = self.state_manager.get_selected_saps_snapshot()
 
-            logger.info("Report generation data:")
-            logger.info("  Performance tests: %d tests", len(tests_to_process))
-            logger.info("  Tests: %s", [(t.test_lab_number, t.sap_code) for t in tests_to_process])
-            logger.info("  Noise SAPs: %s", noise_saps)
-            logger.info("  Comparison SAPs: %s", comparison_saps)
-
-            self._log_fine_grained_selections(comparison_saps, noise_saps)
+            if logger.isEnabledFor(logging.INFO):
+                self._log_report_inputs(tests_to_process, noise_saps, comparison_saps)
 
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"Motor_Performance_Report_{timestamp}.xlsx"
@@ -194,7 +196,16 @@ class ReportGenerationController:
             self.state_manager.end_operation()
             self._update_generate_button_state(generating=False)
 
-    def _log_fine_grained_selections(self, comparison_saps: list, noise_saps: list) -> None:
+    def _log_report_inputs(self, tests_to_process: list, noise_saps: Sequence[str], comparison_saps: Sequence[str]) -> None:
+        """Log the report inputs; callers skip this entirely when INFO is disabled."""
+        logger.info("Report generation data:")
+        logger.info("  Performance tests: %d tests", len(tests_to_process))
+        logger.info("  Tests: %s", [(t.test_lab_number, t.sap_code) for t in tests_to_process])
+        logger.info("  Noise SAPs: %s", noise_saps)
+        logger.info("  Comparison SAPs: %s", comparison_saps)
+        self._log_fine_grained_selections(comparison_saps, noise_saps)
+
+    def _log_fine_grained_selections(self, comparison_saps: Sequence[str], noise_saps: Sequence[str]) -> None:
         if comparison_saps:
             for sap in comparison_saps:
                 selected_labs = self.state_manager.state.selected_comparison_test_labs.get(sap, set())
@@ -218,27 +229,24 @@ class ReportGenerationController:
         if hasattr(state, "comparison_groups") and state.comparison_groups:
             logger.info("Converting new comparison_groups format to multiple_comparisons for report")
             for group_id, group_data in state.comparison_groups.items():
-                if isinstance(group_data, dict) and group_data:
-                    all_test_labs = []
-                    for sap_code, test_labs in group_data.items():
-                        if test_labs:
-                            all_test_labs.extend(list(test_labs))
-
-                    if all_test_labs:
-                        comparison_group = {
-                            "id": group_id,
-                            "name": group_id,
-                            "test_labs": all_test_labs,
-                            "description": f"Comparison group with {len(group_data)} SAPs",
-                            "sap_data": group_data,
-                        }
-                        multiple_comparisons.append(comparison_group)
-                        logger.info(
-                            "  Converted group %s: %d test labs from %d SAPs",
-                            group_id,
-                            len(all_test_labs),
-                            len(group_data),
-                        )
+                if not isinstance(group_data, dict) or not group_data:
+                    continue
+                all_test_labs = list(chain.from_iterable(labs for labs in group_data.values() if labs))
+                if not all_test_labs:
+                    continue
+                multiple_comparisons.append({
+                    "id": group_id,
+                    "name": group_id,
+                    "test_labs": all_test_labs,
+                    "description": f"Comparison group with {len(group_data)} SAPs",
+                    "sap_data": group_data,
+                })
+                logger.info(
+                    "  Converted group %s: %d test labs from %d SAPs",
+                    group_id,
+                    len(all_test_labs),
+                    len(group_data),
+                )
 
         if not multiple_comparisons and hasattr(state, "multiple_comparisons"):
             multiple_comparisons = state.multiple_comparisons
@@ -247,33 +255,78 @@ class ReportGenerationController:
         logger.info("Final multiple_comparisons for report: %d groups", len(multiple_comparisons))
         return multiple_comparisons
 
+    @cached_property
+    def _temp_dir(self) -> str:
+        """System temp directory, resolved on the first report and reused afterwards."""
+        return tempfile.gettempdir()
+
     def _create_temp_file_safely(self, filename: str) -> str:
-        with self._temp_file_lock:
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(temp_dir, filename)
-            self._temp_files_created.add(temp_path)
-            self._temp_report_file = temp_path
-            self._report_filename = filename
-            return temp_path
+        # No lock: start_operation() already allows one generation at a time,
+        # nothing reads these fields under a lock, and set.add is atomic.
+        # mkstemp claims a unique name with one exclusive create, so reports
+        # generated within the same second never share a temp file.
+        name, ext = os.path.splitext(filename)
+        fd, temp_path = tempfile.mkstemp(prefix=f"{name}_", suffix=ext, dir=self._temp_dir)
+        os.close(fd)  # The report writer reopens the file by path
+        # The temp file is the only copy of a generated report (it is opened
+        # from there), so earlier reports stay on disk; only the tracking of
+        # the superseded one is dropped to keep the set bounded.
+        if self._temp_report_file:
+            self._temp_files_created.discard(self._temp_report_file)
+        self._temp_files_created.add(temp_path)
+        self._temp_report_file = temp_path
+        self._report_filename = filename
+        return temp_path
+
+    def _open_overlay_dialog(self, dialog: ft.AlertDialog) -> None:
+        """Open a reusable dialog, adding it to the page overlay only the first time."""
+        overlay = self.gui.page.overlay
+        dialog.open = True
+        if not any(existing is dialog for existing in overlay):
+            overlay.append(dialog)
+            # A new overlay entry only reaches the client on a page update
+            self.gui.page.update()
+        else:
+            self._update_dialog(dialog)
+
+    def _close_dialog(self, dialog: ft.AlertDialog) -> None:
+        dialog.open = False
+        self._update_dialog(dialog)
+
+    def _update_dialog(self, dialog: ft.AlertDialog) -> None:
+        """Send only the dialog's own diff; fall back to a page update if it is not mounted."""
+        try:
+            dialog.update()
+        except Exception as exc:
+            logger.debug("Dialog update failed, updating page: %s", exc)
+            self.gui.page.update()
 
     def _show_download_success_dialog(self, filename: str, full_path: str) -> None:
+        success_dialog = self._success_dialog
+        if success_dialog is None:
+            success_dialog = self._success_dialog = self._build_success_dialog()
+
+        refs = success_dialog.data
+        refs["full_path"] = full_path
+        refs["filename"].value = filename
+        refs["location"].value = os.path.dirname(full_path)
+        self._open_overlay_dialog(success_dialog)
+
+    def _build_success_dialog(self) -> ft.AlertDialog:
+        """Build the reusable download dialog; per-report fields live in ``data``."""
+
         def on_open_folder(_: ft.ControlEvent) -> None:
-            folder_path = os.path.dirname(full_path)
             try:
-                if platform.system() == "Windows":
-                    subprocess.run(f'explorer /select,"{full_path}"', shell=True, check=False)
-                elif platform.system() == "Darwin":
-                    subprocess.run(["open", "-R", full_path], check=False)
-                else:
-                    subprocess.run(["xdg-open", folder_path], check=False)
-                success_dialog.open = False
-                self.gui.page.update()
+                reveal_in_file_manager(success_dialog.data["full_path"])
+                self._close_dialog(success_dialog)
             except Exception as exc:  # pragma: no cover - defensive logging
                 logger.error("Error opening folder: %s", exc)
 
         def on_close_success(_: ft.ControlEvent) -> None:
-            success_dialog.open = False
-            self.gui.page.update()
+            self._close_dialog(success_dialog)
+
+        filename_text = ft.Text("", size=13, selectable=True)
+        location_text = ft.Text("", size=12, selectable=True, color="#666666")
 
         success_dialog = ft.AlertDialog(
             modal=True,
@@ -287,10 +340,10 @@ class ReportGenerationController:
                             content=ft.Column(
                                 [
                                     ft.Text("📄 Filename:", size=12, weight=ft.FontWeight.BOLD),
-                                    ft.Text(filename, size=13, selectable=True),
+                                    filename_text,
                                     ft.Container(height=8),
                                     ft.Text("📁 Location:", size=12, weight=ft.FontWeight.BOLD),
-                                    ft.Text(os.path.dirname(full_path), size=12, selectable=True, color="#666666"),
+                                    location_text,
                                 ],
                                 spacing=4,
                             ),
@@ -316,16 +369,25 @@ class ReportGenerationController:
                 ),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
+            data={"filename": filename_text, "location": location_text, "full_path": None},
         )
-
-        self.gui.page.overlay.append(success_dialog)
-        success_dialog.open = True
-        self.gui.page.update()
+        return success_dialog
 
     def _show_report_error_dialog(self, error_message: str) -> None:
+        error_dialog = self._error_dialog
+        if error_dialog is None:
+            error_dialog = self._error_dialog = self._build_error_dialog()
+
+        error_dialog.data["error"].value = error_message
+        self._open_overlay_dialog(error_dialog)
+
+    def _build_error_dialog(self) -> ft.AlertDialog:
+        """Build the reusable report error dialog; the message Text lives in ``data``."""
+
         def on_close(_: ft.ControlEvent) -> None:
-            error_dialog.open = False
-            self.gui.page.update()
+            self._close_dialog(error_dialog)
+
+        error_text = ft.Text("", size=12, selectable=True)
 
         error_dialog = ft.AlertDialog(
             modal=True,
@@ -336,7 +398,7 @@ class ReportGenerationController:
                         ft.Text("An error occurred while generating the report:", size=14),
                         ft.Container(height=10),
                         ft.Container(
-                            content=ft.Text(error_message, size=12, selectable=True),
+                            content=error_text,
                             padding=ft.padding.all(12),
                             bgcolor="#fff0f0",
                             border_radius=8,
@@ -351,9 +413,6 @@ class ReportGenerationController:
             ),
             actions=[ft.TextButton("Close", on_click=on_close)],
             actions_alignment=ft.MainAxisAlignment.END,
+            data={"error": error_text},
         )
-
-        self.gui.page.overlay.append(error_dialog)
-        error_dialog.open = True
-        self.gui.page.update()
-
+        return error_dialog
@@ -316,11 +316,13 @@ class ReportManager:
             import sys
             
             if sys.platform == "win32":
-                subprocess.run(['start', '', str(output_path)], shell=True, check=True)
+                # Same as cmd's "start", without spawning cmd.exe
+                import os
+                os.startfile(str(output_path))
             elif sys.platform == "darwin":
-                subprocess.run(['open', str(output_path)], check=True)
+                subprocess.Popen(['open', str(output_path)])
             else:
-                subprocess.run(['xdg-open', str(output_path)], check=True)
+                subprocess.Popen(['xdg-open', str(output_path)])
                 
             logger.info(f"Opened report file: {output_path}")
             self.gui.status_manager.update_status(f"Opened report: {output_path.name}", "green")
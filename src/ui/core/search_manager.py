@@ -36,12 +36,17 @@ class SearchManager:
         """Get state manager from GUI"""
         return self.gui.state_manager
     
-    def display_search_results(self):
-        """Display search results with optimized performance and SAP navigation"""
+    def display_search_results(self, refresh: bool = True):
+        """Display search results with optimized performance and SAP navigation
+
+        Args:
+            refresh: When False the controls are rebuilt but no update is sent,
+                so the caller can push them together with its own changes.
+        """
         try:
             all_tests = list(self.state.state.found_tests)
             if not all_tests:
-                self._display_empty_results()
+                self._display_empty_results(refresh=refresh)
                 self._hide_navigation()
                 return
 
@@ -51,12 +56,13 @@ class SearchManager:
             self._results_builder.render(
                 visible_tests=filtered_tests,
                 all_tests=all_tests,
-                filters_active=filters_active
+                filters_active=filters_active,
+                refresh=refresh
             )
             
         except Exception as e:
             logger.error(f"Error displaying search results: {e}")
-            self._display_error_fallback()
+            self._display_error_fallback(refresh=refresh)
     
     def _update_navigation(self):
         """Update SAP navigation controls"""
@@ -91,7 +97,7 @@ class SearchManager:
         except Exception as e:
             logger.error(f"Error refreshing SAP display: {e}")
     
-    def _display_empty_results(self):
+    def _display_empty_results(self, refresh: bool = True):
         """Display empty state efficiently"""
         self.gui.results_area.controls.clear()
         self.gui.results_area.controls.append(
@@ -105,9 +111,10 @@ class SearchManager:
                 alignment=ft.alignment.center
             )
         )
-        self.gui._safe_page_update()
+        if refresh:
+            self.gui._safe_page_update()
     
-    def _display_error_fallback(self):
+    def _display_error_fallback(self, refresh: bool = True):
         """Display error state"""
         self.gui.results_area.controls.clear()
         self.gui.results_area.controls.append(
@@ -121,7 +128,8 @@ class SearchManager:
                 alignment=ft.alignment.center
             )
         )
-        self.gui._safe_page_update()
+        if refresh:
+            self.gui._safe_page_update()
     
     def _update_results_ui(self):
         """Update UI elements efficiently after displaying results"""
@@ -261,7 +269,8 @@ class SearchResultsBuilder:
         self,
         visible_tests: List[Test],
         all_tests: List[Test],
-        filters_active: bool = False
+        filters_active: bool = False,
+        refresh: bool = True
     ):  # noqa: D401 - documentation inherited
         total_tests = len(all_tests)
         visible_total = len(visible_tests)
@@ -273,7 +282,7 @@ class SearchResultsBuilder:
         )
 
         if not all_tests:
-            self._render_empty()
+            self._render_empty(refresh=refresh)
             return
 
         gui = self.gui
@@ -307,7 +316,7 @@ class SearchResultsBuilder:
         sap_visible = len(current_visible_tests) if filters_active else sap_total
 
         if not current_visible_tests and filters_active:
-            self._render_filtered_empty(total_tests, current_sap)
+            self._render_filtered_empty(total_tests, current_sap, refresh=refresh)
             self._update_navigation(all_tests)
             return
 
@@ -324,8 +333,9 @@ class SearchResultsBuilder:
                     padding=20
                 )
             )
-            gui._safe_page_update()
             self._update_navigation(all_tests)
+            if refresh:
+                gui._safe_page_update()
             return
 
         # Update paginator with current display tests
@@ -391,10 +401,14 @@ class SearchResultsBuilder:
             current_sap,
             sap_total,
             sap_visible,
-            filters_active
+            filters_active,
+            refresh=refresh
         )
         self._update_navigation(all_tests)
 
+        if not refresh:
+            return
+
         try:
             gui.results_area.update()
         except Exception as update_err:
@@ -467,7 +481,7 @@ class SearchResultsBuilder:
         
         gui._safe_page_update()
 
-    def _render_empty(self):
+    def _render_empty(self, refresh: bool = True):
         gui = self.gui
         gui.results_area.controls.clear()
         gui.results_area.controls.append(
@@ -482,11 +496,12 @@ class SearchResultsBuilder:
             )
         )
         self._update_selection_indicator()
-        self._update_status(0, 0, "", 0, 0, False)
+        self._update_status(0, 0, "", 0, 0, False, refresh=refresh)
         self._update_navigation([])
-        gui._safe_page_update()
+        if refresh:
+            gui._safe_page_update()
 
-    def _render_filtered_empty(self, total_tests: int, current_sap: Optional[str] = None):
+    def _render_filtered_empty(self, total_tests: int, current_sap: Optional[str] = None, refresh: bool = True):
         gui = self.gui
         gui.results_area.controls.clear()
         sap_note = f" for SAP {current_sap}" if current_sap else ""
@@ -507,8 +522,9 @@ class SearchResultsBuilder:
             )
         )
         self._update_selection_indicator()
-        self._update_status(total_tests, 0, current_sap or "", 0, 0, True)
-        gui._safe_page_update()
+        self._update_status(total_tests, 0, current_sap or "", 0, 0, True, refresh=refresh)
+        if refresh:
+            gui._safe_page_update()
 
     def _build_header(
         self,
@@ -662,7 +678,8 @@ class SearchResultsBuilder:
         current_sap: str,
         sap_total: int,
         sap_visible: int,
-        filters_active: bool
+        filters_active: bool,
+        refresh: bool = True
     ):
         if not hasattr(self.gui, 'status_manager') or not self.gui.status_manager:
             return
@@ -680,15 +697,17 @@ class SearchResultsBuilder:
         if selected_count > 0:
             self.gui.status_manager.update_status(
                 f"✅ {selected_count} of {total_tests} tests selected{sap_info}. Click 'Configure' to continue.",
-                "green"
+                "green",
+                refresh=refresh
             )
         elif total_tests > 0:
             self.gui.status_manager.update_status(
                 f"Found {total_tests} test(s){sap_info}. Select the ones to include in your report.",
-                "blue"
+                "blue",
+                refresh=refresh
             )
         else:
-            self.gui.status_manager.update_status("No tests found for this search.", "orange")
+            self.gui.status_manager.update_status("No tests found for this search.", "orange", refresh=refresh)
 
     def _update_navigation(self, tests):
         if not hasattr(self.gui, 'sap_navigation_container'):
@@ -4,7 +4,7 @@ Manages all application state including selected tests, configurations, and work
 """
 import logging
 import os
-from typing import List, Dict, Set, Optional, Callable, Any
+from typing import List, Dict, Set, Optional, Callable, Any, Tuple
 from dataclasses import dataclass, field
 from ..utils.selection_cache import SelectionCache
 from ...data.models import Test
@@ -346,6 +346,14 @@ class StateManager:
         
         self.notify_observers("search_selection_cleared")
 
+    def clear_config_selection(self):
+        """Clear the noise/comparison SAP selections and mark the configuration unapplied"""
+        self.state.selected_noise_saps.clear()
+        self.state.selected_comparison_saps.clear()
+        self.state.config_selection_applied = False
+        
+        self.notify_observers("config_selection_cleared")
+
     def _remove_noise_test_reference(self, sap_code: Optional[str], test_id: str):
         if not sap_code:
             return
@@ -404,6 +412,21 @@ class StateManager:
             "selected": selected
         })
     
+    def get_sap_selection(self, sap_type: str, sap_code: str) -> bool:
+        """Return whether a SAP is currently selected for the given type"""
+        sap_set = getattr(self.state, f"selected_{sap_type}_saps", None)
+        return sap_set is not None and sap_code in sap_set
+    
+    def get_selected_saps_snapshot(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Return immutable (noise, comparison) snapshots of the selected SAP codes.
+        
+        Report generation runs in the background while the user may keep
+        editing the selection, so it works on a copy taken at submit time.
+        """
+        state = self.state
+        return tuple(state.selected_noise_saps), tuple(state.selected_comparison_saps)
+    
     def update_paths(self, tests_folder: Optional[str] = None, registry_file: Optional[str] = None, 
                      noise_folder: Optional[str] = None, noise_registry: Optional[str] = None,
                      test_lab_dir: Optional[str] = None):
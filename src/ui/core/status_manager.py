@@ -56,7 +56,7 @@ class StatusManager:
         self.update_callback = update_callback or (lambda: None)
         self._color_resolver = color_resolver
     
-    def update_status(self, message: str, color: str = 'black'):
+    def update_status(self, message: str, color: str = 'black', refresh: bool = True):
         """
         Update the status text with a message and color.
         
@@ -65,6 +65,8 @@ class StatusManager:
             color: Color for the status text (default: 'black')
                    Common values: 'green' (success), 'red' (error), 
                    'blue' (info), 'orange' (warning)
+            refresh: Trigger the update callback (set False when the caller
+                     batches several changes into one page update)
         
         Thread Safety:
             Handles RuntimeError and AttributeError during shutdown gracefully.
@@ -75,7 +77,7 @@ class StatusManager:
             logger.info(f"GUI Status Update: {message}")
             
             # Safe callback execution
-            if self.update_callback:
+            if refresh and self.update_callback:
                 try:
                     self.update_callback()
                 except (RuntimeError, AttributeError) as e:
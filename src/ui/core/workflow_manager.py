@@ -57,7 +57,7 @@ class WorkflowManager:
                     # Available step
                     tab.text = f"{i + 1}. {self.step_names[i]}"
     
-    def _update_status_message(self):
+    def _update_status_message(self, refresh: bool = True):
         """Update status message based on current step"""
         step_messages = {
             0: "Configure your input paths, then click the 'Search & Select' tab to continue.",
@@ -68,7 +68,7 @@ class WorkflowManager:
         
         message = step_messages.get(self.current_step, "Follow the workflow steps.")
         if hasattr(self.gui, 'status_manager') and self.gui.status_manager:
-            self.gui.status_manager.update_status(message, "blue")
+            self.gui.status_manager.update_status(message, "blue", refresh=refresh)
     
     def go_to_step(self, step: int):
         """Navigate to a specific step"""
@@ -86,10 +86,16 @@ class WorkflowManager:
         self._update_status_message()
         self.gui._safe_page_update()
     
-    def update_workflow_state(self):
-        """Public method to update workflow state"""
+    def update_workflow_state(self, refresh: bool = True):
+        """
+        Public method to update workflow state.
+        
+        Args:
+            refresh: Let the status message trigger a page update (set False
+                     when the caller sends one page update for all its changes)
+        """
         self._update_tab_titles()
-        self._update_status_message()
+        self._update_status_message(refresh)
 
     def refresh_tab(self, tab_name):
         """
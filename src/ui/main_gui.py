@@ -792,7 +792,7 @@ class MotorReportAppGUI:
             
             # Initialize backend with auto-detected paths
             if PERFORMANCE_TEST_DIR and LAB_REGISTRY_FILE:
-                run_in_background(self._initialize_backend)
+                self.event_handlers.start_backend_initialization()
                 self.status_manager.update_status("🎯 Auto-detected paths loaded successfully. Backend initialized.", "green")
             
             self._safe_page_update()
@@ -840,9 +840,9 @@ class MotorReportAppGUI:
     def _go_to_search_select_tab(self):
         self._go_to_tab(1)
 
-    def _display_search_results(self):
+    def _display_search_results(self, refresh: bool = True):
         """Displays the current search results in the results_area."""
-        self.search_manager.display_search_results()
+        self.search_manager.display_search_results(refresh=refresh)
 
     def _enhanced_search_results_display(self):
         """Enhanced results delegate to SearchManager for consistent UI."""
@@ -929,10 +929,6 @@ class MotorReportAppGUI:
         else:
             logger.debug("Config tab refresh handled through standard page refresh")
 
-    def _initialize_backend(self):
-        """Initializes the backend MotorReportApp."""
-        self.event_handlers._initialize_backend()
-
     def _update_backend_config(self):
         """Updates the backend configuration with current paths."""
         if not self.app: return
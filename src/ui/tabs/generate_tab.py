@@ -1286,8 +1286,6 @@ class GenerateTab(BaseTab):
     def _try_in_place_refresh(self) -> bool:
         """Try to refresh just the summary content without replacing the entire tab"""
         try:
-            import time
-            
             logger.info("🔧 Attempting in-place content refresh...")
             
             # Check if we have a valid summary container reference
@@ -1320,12 +1318,10 @@ class GenerateTab(BaseTab):
                                     new_summary_content.visible = True
                                     self.summary_container.visible = True
                                     
-                                    # Perform strategic updates with safety checks
+                                    # One page update carries the new summary
                                     if (self.parent_gui and 
                                         hasattr(self.parent_gui, '_safe_page_update')):
                                         self.parent_gui._safe_page_update()
-                                        time.sleep(0.02)
-                                        self.parent_gui._safe_page_update()
                                     
                                     logger.info("✅ In-place summary refresh completed")
                                     return True
@@ -0,0 +1,31 @@
+"""
+Folder Reveal - Show a saved file in the platform's file manager.
+
+Shared by EventHandlers and ReportGenerationController for their
+"Open Folder" buttons. The file manager is launched without a shell and
+without waiting for it, so the calling UI handler returns immediately.
+"""
+import os
+import platform
+import subprocess
+from typing import Callable
+
+
+def _reveal_windows(full_path: str) -> None:
+    # "/select," must be its own argument so explorer receives the path quoted separately
+    subprocess.Popen(["explorer", "/select,", os.path.normpath(full_path)])
+
+
+def _reveal_macos(full_path: str) -> None:
+    subprocess.Popen(["open", "-R", full_path])
+
+
+def _reveal_linux(full_path: str) -> None:
+    subprocess.Popen(["xdg-open", os.path.dirname(full_path)])
+
+
+# Resolved once at import; the platform does not change while the app runs
+reveal_in_file_manager: Callable[[str], None] = {
+    "Windows": _reveal_windows,
+    "Darwin": _reveal_macos,
+}.get(platform.system(), _reveal_linux)
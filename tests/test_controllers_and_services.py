@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+import threading
 from unittest.mock import MagicMock, patch
+import flet as ft
 import pytest
 
 from src.ui.core.file_picker_controller import FilePickerController
 from src.ui.core.configuration_controller import ConfigurationController
+from src.ui.core.report_generation_controller import ReportGenerationController
 from src.ui.core.state_manager import StateManager
 from src.services.noise_registry_loader import NoiseRegistryLoader
 
@@ -79,6 +82,176 @@ class TestFilePickerController:
         assert state_manager.state.selected_registry_file == str(registry_file)
 
 
+    def test_folder_pick_styles_label_and_updates_page_once(
+        self, controller: FilePickerController, state_manager: StateManager, mock_gui: MagicMock, tmp_path: Path
+    ):
+        """Test that a folder pick styles its label and sends a single page update."""
+        state_manager.state.picker_context = "noise_folder"
+        mock_gui.app = None
+
+        controller.on_folder_picked(MagicMock(path=str(tmp_path)))
+
+        label = mock_gui.noise_folder_path_text
+        assert (label.value, label.color, label.italic) == (f"Selected: {tmp_path}", "green", False)
+        assert state_manager.state.picker_context == ""
+        mock_gui._safe_page_update.assert_called_once()
+
+    def test_file_pick_dispatches_on_context_with_registry_default(
+        self, controller: FilePickerController, state_manager: StateManager, mock_gui: MagicMock, tmp_path: Path
+    ):
+        """Test that file picks route by picker_context and default to the registry file."""
+        mock_gui.app = None
+        picked = tmp_path / "tests" / "any.csv"
+
+        state_manager.state.picker_context = "test_folder_via_file"
+        controller.on_registry_file_picked(MagicMock(path=str(picked)))
+        assert state_manager.state.selected_tests_folder == str(picked.parent)
+
+        controller.on_registry_file_picked(MagicMock(path=str(picked)))
+        assert state_manager.state.selected_registry_file == str(picked)
+
+    def test_burst_of_picks_triggers_one_backend_update(self, controller: FilePickerController, mock_gui: MagicMock):
+        """Test that backend config updates are debounced across quick picks."""
+        done = threading.Event()
+        mock_gui._update_backend_config.side_effect = done.set
+        controller.BACKEND_UPDATE_DELAY_SECONDS = 0.05
+
+        for _ in range(3):
+            controller._trigger_backend_config_update()
+
+        assert done.wait(5)
+        controller._backend_update_timer.join(5)
+        mock_gui._update_backend_config.assert_called_once()
+
+
+# ============================================================================
+# ReportGenerationController Tests
+# ============================================================================
+
+
+class TestReportGenerationController:
+    """Tests for ReportGenerationController extracted from EventHandlers."""
+
+    @pytest.fixture
+    def state_manager(self) -> StateManager:
+        """Create a StateManager instance for testing."""
+        return StateManager()
+
+    @pytest.fixture
+    def mock_gui(self, state_manager: StateManager) -> MagicMock:
+        """Create a mock GUI with required attributes."""
+        gui = MagicMock()
+        gui.state_manager = state_manager
+        gui.page = MagicMock()
+        gui.page.overlay = []
+        return gui
+
+    @pytest.fixture
+    def controller(self, mock_gui: MagicMock, state_manager: StateManager) -> ReportGenerationController:
+        """Create a ReportGenerationController instance."""
+        return ReportGenerationController(mock_gui, state_manager, update_button_state=MagicMock())
+
+    def test_comparison_groups_are_flattened_per_group(self, controller: ReportGenerationController, state_manager: StateManager):
+        """Test that each non-empty group becomes one report comparison."""
+        state_manager.state.comparison_groups = {
+            "G1": {"612057": {"T1"}, "612058": {"T2", "T3"}, "612059": set()},
+            "G2": {"612060": set()},
+            "G3": {},
+        }
+
+        result = controller._build_multiple_comparisons()
+
+        assert [group["id"] for group in result] == ["G1"]
+        assert sorted(result[0]["test_labs"]) == ["T1", "T2", "T3"]
+        assert result[0]["description"] == "Comparison group with 3 SAPs"
+
+    def test_report_inputs_are_not_logged_when_info_is_disabled(self, controller: ReportGenerationController, state_manager: StateManager):
+        """Test that the per-test input summary is skipped below INFO."""
+        state_manager.get_tests_to_process = MagicMock(return_value=[MagicMock()])
+        controller._create_temp_file_safely = MagicMock(return_value="report.xlsx")
+
+        with patch("src.ui.core.report_generation_controller.logger") as mock_logger, \
+                patch.object(controller, "_log_report_inputs") as log_inputs:
+            mock_logger.isEnabledFor.return_value = False
+            controller._generate_report()
+
+        log_inputs.assert_not_called()
+        controller.gui.report_manager.generate_report_with_path.assert_called_once()
+
+    def test_report_uses_selected_saps_snapshot(self, controller: ReportGenerationController, state_manager: StateManager):
+        """Test that generation receives immutable copies of the SAP selection."""
+        state_manager.get_tests_to_process = MagicMock(return_value=[MagicMock()])
+        controller._create_temp_file_safely = MagicMock(return_value="report.xlsx")
+        state_manager.state.selected_noise_saps = {"612057"}
+        state_manager.state.selected_comparison_saps = {"612058"}
+
+        controller._generate_report()
+
+        kwargs = controller.gui.report_manager.generate_report_with_path.call_args.kwargs
+        assert kwargs["noise_saps"] == ("612057",)
+        assert kwargs["comparison_saps"] == ("612058",)
+
+    def test_download_success_dialog_is_reused_with_new_values(self, controller: ReportGenerationController, mock_gui: MagicMock):
+        """Test that repeated downloads reuse one overlay dialog."""
+        controller._show_download_success_dialog("a.xlsx", "/out/one/a.xlsx")
+        dialog = controller._success_dialog
+        controller._show_download_success_dialog("b.xlsx", "/out/two/b.xlsx")
+
+        assert mock_gui.page.overlay == [dialog]
+        assert controller._success_dialog is dialog
+        assert dialog.open is True
+        assert dialog.data["filename"].value == "b.xlsx"
+        assert dialog.data["location"].value == "/out/two"
+        assert dialog.data["full_path"] == "/out/two/b.xlsx"
+
+    def test_report_error_dialog_is_reused_with_new_message(self, controller: ReportGenerationController, mock_gui: MagicMock):
+        """Test that repeated failures reuse one overlay dialog."""
+        controller._show_report_error_dialog("first")
+        controller._show_report_error_dialog("second")
+
+        assert mock_gui.page.overlay == [controller._error_dialog]
+        assert controller._error_dialog.data["error"].value == "second"
+
+    def test_reopening_a_mounted_dialog_updates_only_the_dialog(self, controller: ReportGenerationController, mock_gui: MagicMock):
+        """Test that only the first show of a dialog needs a page update."""
+        controller._show_report_error_dialog("first")
+        dialog = controller._error_dialog
+        mock_gui.page.update.reset_mock()
+
+        with patch.object(ft.AlertDialog, "update") as dialog_update:
+            controller._show_report_error_dialog("second")
+            controller._close_dialog(dialog)
+
+        assert dialog_update.call_count == 2
+        assert dialog.open is False
+        mock_gui.page.update.assert_not_called()
+
+    def test_save_without_destination_folder_is_ignored(self, controller: ReportGenerationController, tmp_path: Path):
+        """Test that an empty folder path does not save into the working directory."""
+        controller._temp_dir = str(tmp_path)
+        Path(controller._create_temp_file_safely("report.xlsx")).write_bytes(b"data")
+
+        with patch("src.ui.core.report_generation_controller.shutil.copyfile") as copyfile:
+            controller.save_report_to_folder("")
+
+        copyfile.assert_not_called()
+        assert controller._success_dialog is None
+
+    def test_new_temp_report_keeps_previous_file_on_disk(self, controller: ReportGenerationController, tmp_path: Path):
+        """Test that a new report leaves the earlier one in place and stops tracking it."""
+        controller._temp_dir = str(tmp_path)
+        first = Path(controller._create_temp_file_safely("first.xlsx"))
+        first.write_bytes(b"data")
+
+        second = controller._create_temp_file_safely("first.xlsx")
+
+        assert second != str(first)
+        assert first.read_bytes() == b"data"
+        assert Path(second).exists()
+        assert controller._temp_files_created == {second}
+        assert controller._report_filename == "first.xlsx"
+
+
 # ============================================================================
 # ConfigurationController Tests
 # ============================================================================
@@ -117,6 +290,107 @@ class TestConfigurationController:
         handler = controller.on_sap_checked("comparison")
         assert callable(handler)
 
+    @pytest.mark.parametrize(
+        "sap_type, container_attr, updater_name",
+        [
+            ("comparison", "comparison_test_lab_containers", "_update_test_lab_checkboxes"),
+            ("noise", "noise_test_lab_containers", "_update_noise_test_checkboxes"),
+        ],
+    )
+    def test_sap_checked_toggles_matching_container(
+        self,
+        controller: ConfigurationController,
+        mock_gui: MagicMock,
+        sap_type: str,
+        container_attr: str,
+        updater_name: str,
+    ):
+        """Test that checking a SAP shows its container and refreshes the right checkboxes."""
+        container = MagicMock(visible=False)
+        setattr(mock_gui.config_tab, container_attr, {"612057": container})
+        event = MagicMock()
+        event.control.data = "612057"
+        event.control.value = True
+
+        controller.on_sap_checked(sap_type)(event)
+
+        assert container.visible is True
+        getattr(mock_gui.config_tab, updater_name).assert_called_once_with("612057")
+        mock_gui._safe_page_update.assert_called_once()
+
+    def test_sap_checked_ignores_unchanged_selection(
+        self, controller: ConfigurationController, mock_gui: MagicMock, state_manager: StateManager
+    ):
+        """Test that re-sending the stored selection skips state and page updates."""
+        state_manager.update_sap_selection("comparison", "612057", True)
+        mock_gui.config_tab.comparison_test_lab_containers = {"612057": MagicMock()}
+        event = MagicMock()
+        event.control.data = "612057"
+        event.control.value = True
+
+        controller.on_sap_checked("comparison")(event)
+
+        assert state_manager.get_sap_selection("comparison", "612057") is True
+        mock_gui._safe_page_update.assert_not_called()
+
+    def test_reselecting_sap_reuses_built_checkboxes(
+        self, controller: ConfigurationController, mock_gui: MagicMock
+    ):
+        """Test that checkboxes are only rebuilt when the container was replaced or the SAP unchecked."""
+        mock_gui.config_tab.comparison_test_lab_containers = {"612057": MagicMock()}
+        updater = mock_gui.config_tab._update_test_lab_checkboxes
+
+        controller._handle_sap_visibility("comparison", "612057", True)
+        controller._handle_sap_visibility("comparison", "612057", True)
+        assert updater.call_count == 1
+
+        controller._handle_sap_visibility("comparison", "612057", False)
+        controller._handle_sap_visibility("comparison", "612057", True)
+        assert updater.call_count == 2
+
+        mock_gui.config_tab.comparison_test_lab_containers = {"612057": MagicMock()}
+        controller._handle_sap_visibility("comparison", "612057", True)
+        assert updater.call_count == 3
+
+    def test_reselecting_noise_sap_retries_the_load(
+        self, controller: ConfigurationController, mock_gui: MagicMock
+    ):
+        """Test that noise checkboxes are reloaded every time, so a failed load can be retried."""
+        mock_gui.config_tab.noise_test_lab_containers = {"612057": MagicMock()}
+        updater = mock_gui.config_tab._update_noise_test_checkboxes
+
+        controller._handle_sap_visibility("noise", "612057", True)
+        controller._handle_sap_visibility("noise", "612057", True)
+
+        assert updater.call_count == 2
+
+    def test_missing_containers_are_rebuilt_with_one_refresh(
+        self, controller: ConfigurationController, mock_gui: MagicMock
+    ):
+        """Test that several missing containers queue a single config tab refresh."""
+        mock_gui.config_tab.comparison_test_lab_containers = {}
+        mock_gui.config_tab.noise_test_lab_containers = {}
+        first, second = MagicMock(visible=False), MagicMock(visible=True)
+
+        def refresh(_tab):
+            mock_gui.config_tab.comparison_test_lab_containers = {"612057": first}
+            mock_gui.config_tab.noise_test_lab_containers = {"612058": second}
+
+        mock_gui.workflow_manager.refresh_tab.side_effect = refresh
+
+        with patch("src.ui.core.configuration_controller.threading.Timer") as timer:
+            controller._handle_sap_visibility("comparison", "612057", True)
+            controller._handle_sap_visibility("noise", "612058", False)
+            timer.assert_called_once()
+
+        controller._flush_rebuilds()
+
+        mock_gui.workflow_manager.refresh_tab.assert_called_once_with("config")
+        assert first.visible is True
+        assert second.visible is False
+        mock_gui.config_tab._update_test_lab_checkboxes.assert_called_once_with("612057")
+        mock_gui._safe_page_update.assert_called_once()
+
 
 # ============================================================================
 # NoiseRegistryLoader Tests
@@ -0,0 +1,105 @@
+"""Tests for the SAP selection and notes dialog components."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import flet as ft
+import pytest
+
+from src.ui.components.dialogs import NotesDialog, SAPSelectionDialog
+
+
+@pytest.fixture
+def mock_gui() -> MagicMock:
+    """Create a mock GUI exposing a page with a real overlay list."""
+    gui = MagicMock()
+    gui.page.overlay = []
+    return gui
+
+
+def _test(sap_code: str, notes: str = "") -> SimpleNamespace:
+    return SimpleNamespace(sap_code=sap_code, test_lab_number=f"T-{sap_code}", notes=notes)
+
+
+class TestSAPSelectionDialog:
+    """Tests for SAPSelectionDialog."""
+
+    def test_show_reuses_built_dialog_and_resets_selection(self, mock_gui: MagicMock):
+        tests = [_test("A"), _test("B")]
+        dialog = SAPSelectionDialog(mock_gui, sap_codes=["A", "B"], tests_to_process=tests)
+
+        dialog.show()
+        first = mock_gui.page.overlay[-1]
+        dialog.sap_checkboxes[0].value = False
+        dialog.show()
+
+        assert mock_gui.page.overlay == [first]
+        assert all(cb.value for cb in dialog.sap_checkboxes)
+
+    def test_show_rebuilds_when_tests_change(self, mock_gui: MagicMock):
+        tests = [_test("A")]
+        dialog = SAPSelectionDialog(mock_gui, sap_codes=["A"], tests_to_process=tests)
+
+        dialog.show()
+        first = mock_gui.page.overlay[-1]
+        tests.append(_test("A"))
+        dialog.show()
+
+        assert mock_gui.page.overlay[-1] is not first
+        assert first not in mock_gui.page.overlay
+        assert len(mock_gui.page.overlay) == 1
+        assert dialog.sap_checkboxes[0].label == "A (2 tests)"
+
+
+class TestNotesDialog:
+    """Tests for NotesDialog."""
+
+    def test_show_rebuilds_only_for_a_different_test(self, mock_gui: MagicMock):
+        dialog = NotesDialog(mock_gui, test=_test("A", "first"))
+
+        dialog.show()
+        first = mock_gui.page.overlay[-1]
+        mock_gui._safe_page_update.reset_mock()
+        dialog.show()
+        assert mock_gui.page.overlay == [first]
+        mock_gui._safe_page_update.assert_not_called()
+
+        dialog.test = _test("B", "second")
+        dialog.show()
+        assert len(mock_gui.page.overlay) == 1
+        assert mock_gui.page.overlay[0] is not first
+
+    def test_show_after_outside_dismiss_does_not_duplicate(self, mock_gui: MagicMock):
+        dialog = NotesDialog(mock_gui, test=_test("A", "notes"))
+
+        dialog.show()
+        shown = mock_gui.page.overlay[-1]
+        shown.open = False  # Non-modal dialog dismissed without _close_dialog
+        dialog.show()
+
+        assert mock_gui.page.overlay == [shown]
+        assert shown.open is True
+
+    def test_dialog_is_built_on_first_show_only(self, mock_gui: MagicMock):
+        dialog = NotesDialog(mock_gui, test=_test("A"))
+        assert dialog._component is None
+
+        dialog.show()
+
+        body = mock_gui.page.overlay[-1].content.controls[1]
+        assert body.value == "No notes available"
+
+    def test_close_removes_only_its_own_dialog(self, mock_gui: MagicMock):
+        other = ft.AlertDialog(open=True)
+        mock_gui.page.overlay.append(other)
+        dialog = NotesDialog(mock_gui, test=_test("A"))
+
+        dialog.show()
+        shown = mock_gui.page.overlay[-1]
+        dialog._close_dialog(None)
+
+        assert shown.open is False
+        assert other.open is True
+        assert mock_gui.page.overlay == [other]
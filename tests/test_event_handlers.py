@@ -0,0 +1,249 @@
+"""Tests for the EventHandlers facade helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ui.core.event_handlers import EventHandlers
+from src.ui.core.state_manager import StateManager
+
+
+@pytest.fixture
+def mock_gui() -> MagicMock:
+    """Create a mock GUI backed by a real StateManager."""
+    gui = MagicMock()
+    gui.state_manager = StateManager()
+    return gui
+
+
+@pytest.fixture
+def handlers(mock_gui: MagicMock) -> EventHandlers:
+    return EventHandlers(mock_gui)
+
+
+class TestGuards:
+    """Tests for the attribute guard helpers."""
+
+    def test_has_gui_component_treats_none_as_missing(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui.workflow_manager = None
+        assert handlers._has_gui_component('workflow_manager') is False
+        assert handlers._has_gui_component('status_manager') is True
+
+    def test_has_gui_property_walks_nested_path(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui.page = SimpleNamespace(overlay=[])
+        assert handlers._has_gui_property('page.overlay') is True
+        assert handlers._has_gui_property('page.missing') is False
+
+    def test_has_state_property_accepts_falsy_non_none_values(self, handlers: EventHandlers):
+        handlers.state.state.picker_context = ""
+        assert handlers._has_state_property('picker_context') is True
+        assert handlers._has_state_property('picker_context.missing') is False
+
+
+class TestLogAction:
+    """Tests for the standardized action log."""
+
+    def test_log_action_formats_enabled_levels(self, handlers: EventHandlers, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="src.ui.core.event_handlers"):
+            handlers._log_action("config_apply", extra_info="Phase 1")
+            handlers._log_action("hidden", level="debug")
+
+        assert [record.getMessage() for record in caplog.records] == ["Action: config_apply - Phase 1"]
+
+
+class TestSafeUpdates:
+    """Tests for the status/results update wrappers."""
+
+    def test_safe_status_update_without_status_manager(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui.status_manager = None
+        assert handlers._safe_status_update("hello") is False
+
+    def test_safe_results_update_falls_back_to_plain_display(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui._enhanced_search_results_display = None
+        mock_gui.page = SimpleNamespace()
+
+        assert handlers._safe_results_update() is True
+        mock_gui._display_search_results.assert_called_once()
+        mock_gui._safe_page_update.assert_called_once()
+
+    def test_safe_results_update_coalesces_queued_refreshes(self, handlers: EventHandlers, mock_gui: MagicMock):
+        queued = []
+        mock_gui.page = SimpleNamespace(invoke_later=queued.append)
+
+        assert handlers._safe_results_update() is True
+        assert handlers._safe_results_update() is True
+        assert len(queued) == 1
+
+        queued.pop()()
+        mock_gui._enhanced_search_results_display.assert_called_once()
+        assert handlers._safe_results_update() is True
+        assert len(queued) == 1
+
+    def test_apply_search_selection_updates_only_search_controls(self, handlers: EventHandlers, mock_gui: MagicMock):
+        handlers.on_apply_search_selection()
+
+        mock_gui._safe_page_update.assert_not_called()
+        # Once for the busy state, once for the final state
+        assert mock_gui.status_manager.status_text.update.call_count == 2
+        assert mock_gui.apply_selection_button.update.call_count == 2
+        mock_gui.results_area.update.assert_called_once()
+        calls = mock_gui.status_manager.update_status.call_args_list
+        assert calls and all(call.kwargs.get("refresh") is False for call in calls)
+        mock_gui._display_search_results.assert_called_once_with(refresh=False)
+        mock_gui.refresh_components.assert_not_called()
+        mock_gui.workflow_manager.update_workflow_state.assert_called_once_with(refresh=False)
+
+    def test_clear_search_selection_restores_button_when_render_fails(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui._display_search_results.side_effect = RuntimeError("render failed")
+
+        with pytest.raises(RuntimeError):
+            handlers.on_clear_search_selection()
+
+        assert mock_gui.clear_selection_button.disabled is False
+        assert mock_gui.clear_selection_button.update.call_count == 2
+
+    def test_apply_config_finishes_in_one_update(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui.generate_tab.refresh_content.return_value = False
+
+        handlers.on_apply_config_selection()
+
+        assert handlers.state.state.config_selection_applied is True
+        mock_gui._safe_page_update.assert_called_once()
+        mock_gui.page.run_task.assert_called_once_with(handlers._delayed_update_after_config_apply)
+        mock_gui.status_manager.update_status.assert_called_once()
+        assert mock_gui.status_manager.update_status.call_args.args[0].startswith(
+            "✅ Configuration applied successfully"
+        )
+
+    def test_apply_config_relies_on_generate_tab_refresh_update(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui.generate_tab.refresh_content.return_value = True
+
+        handlers.on_apply_config_selection()
+
+        mock_gui.generate_tab.refresh_content.assert_called_once()
+        mock_gui._safe_page_update.assert_not_called()
+
+    def test_apply_config_reclick_cancels_pending_reapply_update(self, handlers: EventHandlers, mock_gui: MagicMock):
+        first, second = Future(), Future()
+        mock_gui.page.run_task.side_effect = [first, second]
+
+        handlers.on_apply_config_selection()
+        handlers.on_apply_config_selection()
+
+        assert first.cancelled()
+        assert handlers._delayed_config_future is second
+
+    def test_apply_config_defers_reapply_state_to_run_task(self, handlers: EventHandlers, mock_gui: MagicMock):
+        scheduled = []
+        mock_gui.page = SimpleNamespace(run_task=scheduled.append)
+
+        handlers.on_apply_config_selection()
+
+        assert scheduled == [handlers._delayed_update_after_config_apply]
+        assert mock_gui.config_apply_button.text == "✅ Configuration Applied!"
+
+
+    def test_clear_config_selection_leaves_the_update_to_the_tab_refresh(
+        self, handlers: EventHandlers, mock_gui: MagicMock
+    ):
+        app_state = handlers.state.state
+        app_state.selected_noise_saps = {"612057"}
+        app_state.selected_comparison_saps = {"612058"}
+        app_state.config_selection_applied = True
+
+        handlers.on_clear_config_selection()
+
+        assert not app_state.selected_noise_saps and not app_state.selected_comparison_saps
+        assert app_state.config_selection_applied is False
+        mock_gui.workflow_manager.update_workflow_state.assert_called_once_with(refresh=False)
+        mock_gui.workflow_manager.refresh_tab.assert_called_once_with('config')
+        mock_gui._safe_page_update.assert_not_called()
+
+
+class TestReportInputs:
+    """Tests for report input preparation."""
+
+    def test_selected_saps_snapshot_is_detached_from_state(self, handlers: EventHandlers):
+        handlers.state.state.selected_noise_saps = {"612057"}
+        handlers.state.state.selected_comparison_saps = {"612058"}
+
+        noise, comparison = handlers.state.get_selected_saps_snapshot()
+        handlers.state.state.selected_noise_saps.add("612059")
+
+        assert noise == ("612057",)
+        assert comparison == ("612058",)
+
+
+class TestSaveDialogs:
+    """Tests for the reusable report result dialogs."""
+
+    def test_report_result_dialogs_are_built_once(self, handlers: EventHandlers, mock_gui: MagicMock):
+        mock_gui.page.overlay = []
+
+        handlers._show_report_error_dialog("first failure")
+        error_dialog = mock_gui.page.overlay[-1]
+        error_dialog.open = False
+        handlers._show_report_error_dialog("second failure")
+        handlers._show_report_success_dialog("r.xlsx", "/tmp/out/r.xlsx")
+        success_dialog = mock_gui.page.overlay[-1]
+
+        assert mock_gui.page.overlay == [error_dialog, success_dialog]
+        assert error_dialog.open is True
+        assert error_dialog.data["error"].value == "second failure"
+        assert success_dialog.data["location"].value == "/tmp/out"
+
+
+class TestSelectionHandlers:
+    """Tests for the selection confirmation handlers."""
+
+    def test_confirm_selection_uses_one_page_update(self, handlers: EventHandlers, mock_gui: MagicMock):
+        handlers.state.state.selected_tests = {"T1": SimpleNamespace(sap_code="612057")}
+
+        handlers.on_confirm_test_selection(None)
+
+        mock_gui.status_manager.status_text.update.assert_called_once()
+        mock_gui.confirm_selection_button.update.assert_called_once()
+        mock_gui._safe_page_update.assert_called_once()
+        mock_gui._go_to_configure_tab.assert_called_once()
+
+
+class TestBackendInitialization:
+    """Tests for building the backend off the UI thread."""
+
+    def test_start_schedules_on_page_event_loop(self, handlers: EventHandlers, mock_gui: MagicMock):
+        scheduled = []
+        mock_gui.page = SimpleNamespace(run_task=scheduled.append)
+
+        handlers.start_backend_initialization()
+
+        assert scheduled == [handlers._initialize_backend_async]
+
+    def test_async_initialization_sets_app_and_reports_status(
+        self, handlers: EventHandlers, mock_gui: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        app = object()
+        monkeypatch.setattr(handlers, "_build_motor_report_app", lambda: app)
+
+        asyncio.run(handlers._initialize_backend_async())
+
+        assert mock_gui.app is app
+        assert mock_gui.status_manager.status_text.value.startswith("Backend initialized successfully")
+        assert mock_gui.status_manager.progress_bar.visible is False
+
+    def test_async_initialization_reports_failure(
+        self, handlers: EventHandlers, mock_gui: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        def fail():
+            raise OSError("registry missing")
+
+        monkeypatch.setattr(handlers, "_build_motor_report_app", fail)
+
+        asyncio.run(handlers._initialize_backend_async())
+
+        assert mock_gui.status_manager.status_text.value == "Backend initialization failed: registry missing"
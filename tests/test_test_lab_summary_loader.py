@@ -79,3 +79,40 @@ def test_load_summary_strict_matching(tmp_path: Path) -> None:
     assert alias_summary is not None
     assert alias_summary.source_path is not None
     assert Path(alias_summary.source_path).name == "67890A.xlsx"
+
+
+def test_collect_notes_joins_columns_b_to_e_below_header() -> None:
+    workbook = Workbook()
+    sheet = cast(Worksheet, workbook.active)
+    sheet["B3"] = "Orifice"
+    sheet["B4"] = "  Motore  "
+    sheet["D4"] = "nuovo"
+    sheet["F4"] = "ignored"
+    sheet["C5"] = "   "
+    sheet["B6"] = "Motore"
+    sheet["D6"] = "nuovo"
+    sheet["E7"] = 42
+
+    loader = TestLabSummaryLoader(None)
+
+    assert loader._collect_notes(sheet, 3) == ["Motore nuovo", "42"]
+
+
+def test_locate_workbook_reuses_cached_match_until_file_disappears(tmp_path: Path) -> None:
+    base_dir = tmp_path / "CARICHI"
+    workbook_path = base_dir / "2024" / "24680.xlsx"
+    _create_test_lab_workbook(workbook_path)
+
+    loader = TestLabSummaryLoader(str(base_dir))
+    first = loader.locate_workbook("24680")
+    assert first is not None
+    assert loader.locate_workbook("24680") is first
+
+    moved_path = base_dir / "2023" / "24680.xlsx"
+    moved_path.parent.mkdir(parents=True)
+    workbook_path.rename(moved_path)
+
+    relocated = loader.locate_workbook("24680")
+    assert relocated is not None
+    assert relocated.path == moved_path
+    assert relocated.year_folder == "2023"